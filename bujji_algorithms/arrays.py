@@ -1,6 +1,34 @@
 import sys
 import time
 from array import array
+from bisect import bisect_left
+
+
+def _filled_array(typecode, fill_value, size):
+    """Build an array of `size` copies of `fill_value` without a temporary Python list."""
+    # Repeating a one-element array is a single allocation plus C-level memcpy.
+    return array(typecode, [fill_value]) * size
+
+
+_MAX_REPR = 8  # items (or rows) shown at each end by __repr__ before the middle is elided
+
+
+def _format_items(seq, n):
+    """Format the first `n` items of `seq` as a list, eliding the middle when n is large."""
+    if n <= 2 * _MAX_REPR:
+        return str(list(seq[:n]))
+    head = ", ".join(map(repr, seq[:_MAX_REPR]))
+    tail = ", ".join(map(repr, seq[n - _MAX_REPR:n]))
+    return f"[{head}, ..., {tail}]"
+
+
+def _format_rows(row_at, rows, cols):
+    """Format a matrix one line per row, only materializing the rows that are shown."""
+    if rows <= 2 * _MAX_REPR:
+        shown = range(rows)
+    else:
+        shown = [*range(_MAX_REPR), None, *range(rows - _MAX_REPR, rows)]
+    return "\n".join("..." if r is None else _format_items(row_at(r), cols) for r in shown)
 
 
 class StaticArray:
@@ -68,25 +96,25 @@ class StaticArray:
             raise ValueError("size must be non-negative")
         # Construct using the array module; this will raise a TypeError if fill_value is incompatible.
         self._size = size
-        self._data = array(typecode, [fill_value] * size)
+        self._data = _filled_array(typecode, fill_value, size)
 
-    def _normalize_index(self, index):
-        """Normalize negative indices to positive and validate range."""
-        if not -self._size <= index < self._size:
-            raise IndexError("Index out of range")
+    # Index normalization is inlined in the accessors below: they are the hot path,
+    # and a helper method call costs more than the checks themselves.
+    def __getitem__(self, index):
         if index < 0:
             index += self._size
-        return index
-
-    def __getitem__(self, index):
-        idx = self._normalize_index(index)
-        return self._data[idx]
+        if not 0 <= index < self._size:
+            raise IndexError("Index out of range")
+        return self._data[index]
 
     def __setitem__(self, index, value):
-        idx = self._normalize_index(index)
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Index out of range")
         # Attempt assignment; if underlying array rejects the type, raise a clearer error.
         try:
-            self._data[idx] = value
+            self._data[index] = value
         except TypeError:
             raise TypeError(
                 f"StaticArray: invalid value type; expected value compatible with typecode '{self._data.typecode}'"
@@ -99,21 +127,21 @@ class StaticArray:
         return iter(self._data)
 
     def __repr__(self):
-        return f"StaticArray({list(self._data)})"
+        return f"StaticArray({_format_items(self._data, self._size)})"
 
     def __contains__(self, value):
         return value in self._data
 
     def fill(self, value):
         """Fill the entire array with a given value (must be compatible with typecode)."""
-        # Assign via indexed writes to get consistent error messages on invalid types.
-        for i in range(self._size):
-            try:
-                self._data[i] = value
-            except TypeError:
-                raise TypeError(
-                    f"StaticArray: invalid value type for fill; expected value compatible with typecode '{self._data.typecode}'"
-                )
+        # Type-check once with a single-element probe, then fill in one C-level slice assignment.
+        try:
+            seed = array(self._data.typecode, [value])
+        except TypeError:
+            raise TypeError(
+                f"StaticArray: invalid value type for fill; expected value compatible with typecode '{self._data.typecode}'"
+            )
+        self._data[:] = seed * self._size
 
     def to_list(self):
         """Return a Python list copy of the array."""
@@ -121,7 +149,7 @@ class StaticArray:
 
     def count(self, value):
         """Count occurrences of a value."""
-        return sum(1 for v in self._data if v == value)
+        return self._data.count(value)
 
     def copy(self):
         """Return a copy of this StaticArray (preserves typecode)."""
@@ -131,13 +159,30 @@ class StaticArray:
         new_arr._data = array(self._data.typecode, self._data)  # copy underlying buffer
         return new_arr
 
+    def as_memoryview(self):
+        """Return a zero-copy memoryview over the underlying buffer."""
+        return memoryview(self._data)
+
+    def tobytes(self):
+        """Return the raw machine representation of the array as bytes."""
+        return self._data.tobytes()
+
+    def __bytes__(self):
+        return self._data.tobytes()
+
+    def __buffer__(self, flags):
+        # PEP 688 (Python 3.12+): lets memoryview(arr), numpy, struct, etc. read the buffer directly.
+        return memoryview(self._data)
+
 
 class DynamicArray:
     """
     A resizable array that grows as elements are added.
 
     Internally uses Python's built-in ``array`` module for contiguous
-    memory storage, doubling capacity when full (amortized O(1) append).
+    memory storage, growing capacity by ~1.5x when full (amortized O(1) append).
+    Use ``reserve`` or ``from_iterable`` to skip intermediate resizes when the
+    final size is known.
 
     Parameters
     ----------
@@ -152,7 +197,7 @@ class DynamicArray:
     >>> arr.append(1)
     >>> arr.append(2)
     >>> arr
-    DynamicArray([1, 2], size=2, capacity=2)
+    DynamicArray([1, 2], size=2, capacity=9)
 
     Access elements:
     >>> arr[1]
@@ -161,16 +206,20 @@ class DynamicArray:
     Insert at index:
     >>> arr.insert(1, 5)
     >>> arr
-    DynamicArray([1, 5, 2], size=3, capacity=4)
+    DynamicArray([1, 5, 2], size=3, capacity=9)
 
     Remove an element:
     >>> arr.remove(5)
     >>> arr
-    DynamicArray([1, 2], size=2, capacity=4)
+    DynamicArray([1, 2], size=2, capacity=9)
 
     Convert to Python list:
     >>> arr.to_list()
     [1, 2]
+
+    Build in one allocation:
+    >>> DynamicArray.from_iterable(range(3))
+    DynamicArray([0, 1, 2], size=3, capacity=3)
     """
 
     __slots__ = ['_data', '_size', '_capacity', '_typecode']
@@ -181,21 +230,60 @@ class DynamicArray:
         self._typecode = typecode
         self._capacity = initial_capacity
         self._size = 0
-        self._data = array(typecode, [0] * initial_capacity)
+        self._data = _filled_array(typecode, 0, initial_capacity)
 
     def _resize(self, new_capacity):
-        """Resize the internal array to new_capacity."""
-        new_data = array(self._typecode, [0] * new_capacity)
-        for i in range(self._size):
-            new_data[i] = self._data[i]
-        self._data = new_data
+        """Grow the internal array to new_capacity."""
+        extra = bytes((new_capacity - self._capacity) * self._data.itemsize)
+        try:
+            # Extend the existing buffer in place: array reallocs its own storage, so the
+            # allocator can often grow the block without moving it and no new array is built.
+            self._data.frombytes(extra)
+        except BufferError:
+            # A live view from as_memoryview() pins the buffer; copy into a fresh array instead.
+            new_data = array(self._typecode, self._data)
+            new_data.frombytes(extra)
+            self._data = new_data
         self._capacity = new_capacity
 
+    def _grow(self):
+        """Grow capacity by ~1.5x (plus a small constant so tiny arrays don't resize every append)."""
+        self._resize(self._capacity + (self._capacity >> 1) + 8)
+
+    def reserve(self, n):
+        """Ensure capacity for at least n elements with a single resize."""
+        if n > self._capacity:
+            self._resize(n)
+
+    @classmethod
+    def from_iterable(cls, iterable, typecode='i'):
+        """Create a DynamicArray from an iterable in a single allocation."""
+        # array(typecode, x) would read bytes-like x as raw machine data, so
+        # go through extend(), which takes their items one by one. extend()
+        # only accepts arrays of the same typecode; others come in as lists.
+        if isinstance(iterable, array) and iterable.typecode != typecode:
+            iterable = iterable.tolist()
+        data = array(typecode)
+        try:
+            data.extend(iterable)
+        except TypeError:
+            raise TypeError(
+                f"DynamicArray: invalid value type; expected value compatible with typecode '{typecode}'"
+            )
+        arr = object.__new__(cls)
+        arr._typecode = typecode
+        arr._size = len(data)
+        if not data:
+            data = _filled_array(typecode, 0, 1)  # keep capacity > 0 like __init__
+        arr._data = data
+        arr._capacity = len(data)
+        return arr
+
     def append(self, value):
         """Add a value to the end of the array."""
         try:
             if self._size == self._capacity:
-                self._resize(self._capacity * 2)
+                self._grow()
             self._data[self._size] = value
             self._size += 1
         except TypeError:
@@ -203,14 +291,30 @@ class DynamicArray:
                 f"DynamicArray: invalid value type; expected value compatible with typecode '{self._typecode}'"
             )
 
+    def extend(self, iterable):
+        """Append every value from an iterable, resizing at most once."""
+        values = array(self._typecode)
+        if isinstance(iterable, array) and iterable.typecode != self._typecode:
+            iterable = iterable.tolist()  # extend() only takes same-typecode arrays
+        try:
+            values.extend(iterable)  # consumes generators too, type-checking in C
+        except TypeError:
+            raise TypeError(
+                f"DynamicArray: invalid value type; expected value compatible with typecode '{self._typecode}'"
+            )
+        needed = self._size + len(values)
+        if needed > self._capacity:
+            self._resize(max(needed, self._capacity + (self._capacity >> 1) + 8))
+        self._data[self._size:needed] = values
+        self._size = needed
+
     def insert(self, index, value):
         """Insert value at a given index (shifts elements right)."""
         if not 0 <= index <= self._size:
             raise IndexError("Index out of range")
         if self._size == self._capacity:
-            self._resize(self._capacity * 2)
-        for i in range(self._size, index, -1):
-            self._data[i] = self._data[i - 1]
+            self._grow()
+        self._data[index + 1:self._size + 1] = self._data[index:self._size]  # shift right via memmove
         try:
             self._data[index] = value
         except TypeError:
@@ -221,26 +325,25 @@ class DynamicArray:
 
     def remove(self, value):
         """Remove first occurrence of value (shifts elements left)."""
-        for i in range(self._size):
-            if self._data[i] == value:
-                for j in range(i, self._size - 1):
-                    self._data[j] = self._data[j + 1]
-                self._size -= 1
-                return
-        raise ValueError(f"{value} not found in DynamicArray")
+        try:
+            i = self._data.index(value, 0, self._size)
+        except ValueError:
+            raise ValueError(f"{value} not found in DynamicArray")
+        self._data[i:self._size - 1] = self._data[i + 1:self._size]  # shift left via memmove
+        self._size -= 1
 
     def __getitem__(self, index):
-        if not -self._size <= index < self._size:
-            raise IndexError("Index out of range")
         if index < 0:
             index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Index out of range")
         return self._data[index]
 
     def __setitem__(self, index, value):
-        if not -self._size <= index < self._size:
-            raise IndexError("Index out of range")
         if index < 0:
             index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Index out of range")
         try:
             self._data[index] = value
         except TypeError:
@@ -256,12 +359,27 @@ class DynamicArray:
             yield self._data[i]
 
     def __repr__(self):
-        return f"DynamicArray({[self._data[i] for i in range(self._size)]}, size={self._size}, capacity={self._capacity})"
+        return f"DynamicArray({_format_items(self._data, self._size)}, size={self._size}, capacity={self._capacity})"
 
     def to_list(self):
         """Return a Python list copy of the array's contents."""
         return [self._data[i] for i in range(self._size)]
 
+    def as_memoryview(self):
+        """Return a zero-copy memoryview over the used part of the buffer (first `size` items)."""
+        return memoryview(self._data)[:self._size]
+
+    def tobytes(self):
+        """Return the raw machine representation of the stored elements as bytes."""
+        return self.as_memoryview().tobytes()
+
+    def __bytes__(self):
+        return self.tobytes()
+
+    def __buffer__(self, flags):
+        # PEP 688 (Python 3.12+): exposes only the used part of the buffer.
+        return self.as_memoryview()
+
 
 class TwoDArray:
     """
@@ -270,6 +388,11 @@ class TwoDArray:
     Uses row-major order with Python's built-in ``array`` for memory efficiency.
     The size (rows × cols) is fixed at creation.
 
+    ``mat[row]`` returns a ``memoryview`` over that row of the shared buffer
+    (writes through it update the matrix). For the character typecodes
+    ('u', 'w'), which a memoryview cannot index, it returns an ``array``
+    copy of the row instead.
+
     Parameters
     ----------
     rows : int
@@ -294,6 +417,8 @@ class TwoDArray:
     1
     >>> mat[0][1]
     1
+    >>> list(mat[1])
+    [1, 1, 1]
 
     Modify elements:
     >>> mat.set(0, 1, 9)
@@ -309,13 +434,16 @@ class TwoDArray:
 
     __slots__ = ['_data', '_rows', '_cols', '_typecode']
 
+    # Typecodes whose memoryview format cannot be indexed
+    _COPY_ROW_TYPECODES = frozenset('uw')
+
     def __init__(self, rows, cols, typecode='i', fill_value=0):
         if rows <= 0 or cols <= 0:
             raise ValueError("rows and cols must be positive integers")
         self._rows = rows
         self._cols = cols
         self._typecode = typecode
-        self._data = array(typecode, [fill_value] * (rows * cols))
+        self._data = _filled_array(typecode, fill_value, rows * cols)
 
     @property
     def shape(self):
@@ -342,31 +470,66 @@ class TwoDArray:
             )
 
     def __getitem__(self, row):
-        """Return a list-like view of a row."""
+        """
+        Return a zero-copy memoryview of a row.
+
+        The view shares the matrix buffer, so writes through it update the
+        matrix; use ``list(mat[row])`` for an independent copy. Typecodes
+        'u' and 'w' get an ``array`` copy of the row instead.
+        """
         if not 0 <= row < self._rows:
             raise IndexError("row index out of range")
         start = row * self._cols
-        end = start + self._cols
-        return self._data[start:end]
+        if self._typecode in self._COPY_ROW_TYPECODES:
+            return self._data[start:start + self._cols]
+        return memoryview(self._data)[start:start + self._cols]
 
     def __len__(self):
         """Number of rows."""
         return self._rows
 
     def __repr__(self):
-        rows_str = "\n".join(
-            str(list(self._data[r * self._cols:(r + 1) * self._cols]))
-            for r in range(self._rows)
-        )
+        cols = self._cols
+        rows_str = _format_rows(lambda r: self._data[r * cols:(r + 1) * cols], self._rows, cols)
         return f"TwoDArray({self._rows}x{self._cols}):\n{rows_str}"
 
+    def to_columnmajor(self):
+        """Return a ColumnMajor2DArray copy of this matrix."""
+        out = object.__new__(ColumnMajor2DArray)
+        out._rows, out._cols, out._typecode = self._rows, self._cols, self._typecode
+        out._data = array(self._typecode, self._data)  # same size and typecode; overwritten below
+        # Each contiguous source row is scattered into the destination with one strided slice.
+        rows, cols = self._rows, self._cols
+        for r in range(rows):
+            out._data[r::rows] = self._data[r * cols:(r + 1) * cols]
+        return out
+
+    def as_memoryview(self):
+        """Return a zero-copy memoryview over the row-major buffer."""
+        return memoryview(self._data)
+
+    def tobytes(self):
+        """Return the raw row-major machine representation as bytes."""
+        return self._data.tobytes()
+
+    def __bytes__(self):
+        return self._data.tobytes()
+
+    def __buffer__(self, flags):
+        # PEP 688 (Python 3.12+): exposes the row-major buffer.
+        return memoryview(self._data)
+
 
 class SparseMatrix:
     """
     A memory-efficient matrix with mostly zero or empty values.
 
-    Stores only non-default values internally in a dictionary, with
-    (row, col) tuples as keys.
+    Stores only non-default values. Writes go to a per-row buffer (sorted
+    column numbers plus the matching values), so ``set`` is a binary search
+    within one row and never touches the others. Bulk reads (``to_csr``,
+    ``to_dense``) compress the rows into Compressed Sparse Row (CSR) form:
+    ``indptr[r]:indptr[r + 1]`` is the slice of ``indices`` and ``values``
+    that belongs to row ``r``. The CSR arrays are cached until the next write.
 
     Parameters
     ----------
@@ -376,6 +539,9 @@ class SparseMatrix:
         Number of columns.
     default_value : Any, optional
         Value to treat as "empty" (default is 0).
+    typecode : str, optional
+        If given, stored values are kept in an ``array`` of this typecode
+        instead of a Python list (default None, i.e. any value type).
 
     Example
     -------
@@ -394,59 +560,151 @@ class SparseMatrix:
     >>> sm.get(1, 1)
     0
 
+    Non-default entries of a row:
+    >>> sm.row_nonzeros(2)
+    (array('q', [2]), [8])
+
+    Compressed form of the whole matrix:
+    >>> sm.to_csr()
+    (array('q', [0, 1, 1, 2]), array('q', [1, 2]), [5, 8])
+
     Remove a value (set to default):
     >>> sm.set(0, 1, 0)
     >>> sm.get(0, 1)
     0
     """
 
-    __slots__ = ['_rows', '_cols', '_default', '_data']
+    __slots__ = ['_rows', '_cols', '_default', '_typecode', '_row_data', '_nnz', '_csr']
 
-    def __init__(self, rows, cols, default_value=0):
+    def __init__(self, rows, cols, default_value=0, typecode=None):
         if rows <= 0 or cols <= 0:
             raise ValueError("rows and cols must be positive integers")
         self._rows = rows
         self._cols = cols
         self._default = default_value
-        self._data = {}  # {(row, col): value}
+        self._typecode = typecode
+        self._row_data = {}  # row -> (sorted columns, values) for non-empty rows
+        self._nnz = 0
+        self._csr = None     # cached (indptr, indices, values); None after a write
 
     @property
     def shape(self):
         """Return (rows, cols)."""
         return (self._rows, self._cols)
 
+    @property
+    def nnz(self):
+        """Number of stored (non-default) entries."""
+        return self._nnz
+
     def _check_index(self, row, col):
         if not (0 <= row < self._rows and 0 <= col < self._cols):
             raise IndexError("row or column index out of range")
 
+    def _new_values(self):
+        return array(self._typecode) if self._typecode else []
+
     def get(self, row, col):
         """Get the value at (row, col)."""
         self._check_index(row, col)
-        return self._data.get((row, col), self._default)
+        entry = self._row_data.get(row)
+        if entry is None:
+            return self._default
+        cols, values = entry
+        pos = bisect_left(cols, col)
+        return values[pos] if pos < len(cols) and cols[pos] == col else self._default
 
     def set(self, row, col, value):
         """Set the value at (row, col). If value == default, remove the entry."""
         self._check_index(row, col)
-        if value == self._default:
-            self._data.pop((row, col), None)
-        else:
-            self._data[(row, col)] = value
+        entry = self._row_data.get(row)
+        if entry is None:
+            if value == self._default:
+                return
+            entry = (array('q'), self._new_values())
+        cols, values = entry
+        pos = bisect_left(cols, col)
+        found = pos < len(cols) and cols[pos] == col
+        try:
+            if value == self._default:
+                if not found:
+                    return
+                del cols[pos]
+                del values[pos]
+                self._nnz -= 1
+                if not cols:
+                    del self._row_data[row]
+            elif found:
+                values[pos] = value
+            else:
+                values.insert(pos, value)
+                cols.insert(pos, col)
+                self._nnz += 1
+                self._row_data[row] = entry
+        except TypeError:
+            raise TypeError(
+                f"SparseMatrix: invalid value type; expected type compatible with '{self._typecode}'"
+            )
+        self._csr = None
 
-    def __getitem__(self, row):
-        """Return a full row as a list."""
+    def row_nonzeros(self, row):
+        """Return (columns, values) of the stored entries in `row` as parallel sequences."""
         if not 0 <= row < self._rows:
             raise IndexError("row index out of range")
-        return [self._data.get((row, c), self._default) for c in range(self._cols)]
+        entry = self._row_data.get(row)
+        if entry is None:
+            return array('q'), self._new_values()
+        return entry[0][:], entry[1][:]
+
+    def to_csr(self):
+        """
+        Return the matrix in CSR form as ``(indptr, indices, values)``.
+
+        The arrays are built once and reused until the next ``set``; treat
+        them as read-only.
+        """
+        if self._csr is None:
+            indptr = _filled_array('q', 0, self._rows + 1)
+            indices = array('q')
+            values = self._new_values()
+            row_data = self._row_data
+            total = 0
+            for r in range(self._rows):
+                entry = row_data.get(r)
+                if entry is not None:
+                    indices.extend(entry[0])
+                    values.extend(entry[1])
+                    total += len(entry[0])
+                indptr[r + 1] = total
+            self._csr = (indptr, indices, values)
+        return self._csr
+
+    def __getitem__(self, row):
+        """Return a full row as a list."""
+        cols, values = self.row_nonzeros(row)
+        dense = [self._default] * self._cols
+        for c, v in zip(cols, values):
+            dense[c] = v
+        return dense
+
+    def to_dense(self):
+        """Return the matrix as a list of row lists."""
+        indptr, indices, values = self.to_csr()
+        default, ncols = self._default, self._cols
+        dense = []
+        for r in range(self._rows):
+            row = [default] * ncols
+            for k in range(indptr[r], indptr[r + 1]):
+                row[indices[k]] = values[k]
+            dense.append(row)
+        return dense
 
     def __len__(self):
         """Number of rows."""
         return self._rows
 
     def __repr__(self):
-        rows_str = "\n".join(
-            str([self._data.get((r, c), self._default) for c in range(self._cols)])
-            for r in range(self._rows)
-        )
+        rows_str = _format_rows(self.__getitem__, self._rows, self._cols)
         return f"SparseMatrix({self._rows}x{self._cols}):\n{rows_str}"
 
 
@@ -489,57 +747,64 @@ class CircularArray:
         self._capacity = capacity
         self._typecode = typecode
         self._overwrite = overwrite
-        self._data = array(typecode, [0] * capacity)
+        self._data = _filled_array(typecode, 0, capacity)
         self._size = 0
         self._front = 0
-        self._rear = -1
-
-    def _advance(self, index):
-        """Move index forward by 1 with wrap-around."""
-        return (index + 1) % self._capacity
+        self._rear = capacity - 1  # one step behind _front, so the first push_back lands at 0
 
-    def _retreat(self, index):
-        """Move index backward by 1 with wrap-around."""
-        return (index - 1 + self._capacity) % self._capacity
+    # The index arithmetic is inlined in the push/pop methods below (they are the hot path).
+    # Indices only ever move by one step, so a compare replaces the integer division of `%`.
+    # Pushes write the slot before touching any state, so a rejected value leaves the buffer unchanged.
 
     def push_back(self, value):
         """Insert value at the rear."""
-        if self._size == self._capacity:
-            if not self._overwrite:
-                raise OverflowError("CircularArray is full")
-            self._front = self._advance(self._front)
-        else:
-            self._size += 1
-        self._rear = self._advance(self._rear)
+        capacity = self._capacity
+        full = self._size == capacity
+        if full and not self._overwrite:
+            raise OverflowError("CircularArray is full")
+        rear = self._rear + 1
+        if rear == capacity:
+            rear = 0
         try:
-            self._data[self._rear] = value
+            self._data[rear] = value
         except TypeError:
             raise TypeError(
                 f"CircularArray: invalid value type; expected type compatible with '{self._typecode}'"
             )
+        self._rear = rear
+        if full:
+            front = self._front + 1
+            self._front = 0 if front == capacity else front
+        else:
+            self._size += 1
 
     def push_front(self, value):
         """Insert value at the front."""
-        if self._size == self._capacity:
-            if not self._overwrite:
-                raise OverflowError("CircularArray is full")
-            self._rear = self._retreat(self._rear)
-        else:
-            self._size += 1
-        self._front = self._retreat(self._front)
+        capacity = self._capacity
+        full = self._size == capacity
+        if full and not self._overwrite:
+            raise OverflowError("CircularArray is full")
+        front = (self._front or capacity) - 1
         try:
-            self._data[self._front] = value
+            self._data[front] = value
         except TypeError:
             raise TypeError(
                 f"CircularArray: invalid value type; expected type compatible with '{self._typecode}'"
             )
+        self._front = front
+        if full:
+            self._rear = (self._rear or capacity) - 1
+        else:
+            self._size += 1
 
     def pop_front(self):
         """Remove and return value from the front."""
         if self._size == 0:
             raise IndexError("CircularArray is empty")
-        value = self._data[self._front]
-        self._front = self._advance(self._front)
+        front = self._front
+        value = self._data[front]
+        front += 1
+        self._front = 0 if front == self._capacity else front
         self._size -= 1
         return value
 
@@ -547,8 +812,9 @@ class CircularArray:
         """Remove and return value from the rear."""
         if self._size == 0:
             raise IndexError("CircularArray is empty")
-        value = self._data[self._rear]
-        self._rear = self._retreat(self._rear)
+        rear = self._rear
+        value = self._data[rear]
+        self._rear = (rear or self._capacity) - 1
         self._size -= 1
         return value
 
@@ -556,20 +822,25 @@ class CircularArray:
         return self._size
 
     def __iter__(self):
-        idx = self._front
-        for _ in range(self._size):
-            yield self._data[idx]
-            idx = self._advance(idx)
+        # The live region is at most two contiguous runs of the buffer.
+        end = self._front + self._size
+        if end <= self._capacity:
+            yield from self._data[self._front:end]
+        else:
+            yield from self._data[self._front:]
+            yield from self._data[:end - self._capacity]
 
     def __repr__(self):
-        return f"CircularArray({list(self)}, size={self._size}, capacity={self._capacity})"
+        return f"CircularArray({_format_items(list(self), self._size)}, size={self._size}, capacity={self._capacity})"
 
 
 class BitArray:
     """
     BitArray (Bit Vector) — compact storage for boolean values.
 
-    Stores bits in a byte array for memory efficiency.
+    Stores bits in 64-bit words (``array('Q')``) for memory efficiency, so bulk
+    operations such as ``count`` and ``set_range`` touch 64 bits per word.
+    Padding bits past ``size`` in the last word are always kept clear.
 
     Parameters
     ----------
@@ -588,17 +859,26 @@ class BitArray:
     True
     >>> bits.count()
     1
+
+    Set a whole range at once:
+    >>> bits.set_range(4, 8, True)
+    >>> bits
+    BitArray(0001111100)
     """
 
     __slots__ = ['_size', '_data']
 
+    _WORD_BITS = 64
+    _WORD_MASK = (1 << 64) - 1
+
     def __init__(self, size, fill=False):
         if size <= 0:
             raise ValueError("size must be > 0")
         self._size = size
-        byte_count = (size + 7) // 8
-        init_byte = 0xFF if fill else 0x00
-        self._data = array('B', [init_byte] * byte_count)
+        word_count = (size + 63) // 64
+        self._data = _filled_array('Q', self._WORD_MASK if fill else 0, word_count)
+        if fill and size % 64:
+            self._data[-1] = (1 << (size % 64)) - 1  # keep padding bits clear
 
     def _check_index(self, index):
         if not 0 <= index < self._size:
@@ -607,17 +887,17 @@ class BitArray:
     def set(self, index, value: bool):
         """Set the bit at index to True or False."""
         self._check_index(index)
-        byte_index, bit_pos = divmod(index, 8)
+        word_index, bit_pos = divmod(index, 64)
         if value:
-            self._data[byte_index] |= (1 << bit_pos)
+            self._data[word_index] |= (1 << bit_pos)
         else:
-            self._data[byte_index] &= ~(1 << bit_pos)
+            self._data[word_index] &= ~(1 << bit_pos)
 
     def get(self, index):
         """Get the boolean value of the bit at index."""
         self._check_index(index)
-        byte_index, bit_pos = divmod(index, 8)
-        return bool(self._data[byte_index] & (1 << bit_pos))
+        word_index, bit_pos = divmod(index, 64)
+        return bool(self._data[word_index] & (1 << bit_pos))
 
     def __getitem__(self, index):
         return self.get(index)
@@ -628,20 +908,49 @@ class BitArray:
     def toggle(self, index):
         """Flip the bit at index."""
         self._check_index(index)
-        byte_index, bit_pos = divmod(index, 8)
-        self._data[byte_index] ^= (1 << bit_pos)
+        word_index, bit_pos = divmod(index, 64)
+        self._data[word_index] ^= (1 << bit_pos)
+
+    def _set_mask(self, word_index, mask, value):
+        """Set or clear the bits selected by `mask` within a single word."""
+        if value:
+            self._data[word_index] |= mask
+        else:
+            self._data[word_index] &= ~mask
+
+    def set_range(self, start, stop, value: bool):
+        """Set every bit in the half-open range [start, stop) to True or False."""
+        if not 0 <= start <= stop <= self._size:
+            raise IndexError("bit range out of range")
+        if start == stop:
+            return
+        first_word, first_bit = divmod(start, 64)
+        last_word, last_bit = divmod(stop, 64)
+        if first_word == last_word:
+            self._set_mask(first_word, ((1 << last_bit) - 1) ^ ((1 << first_bit) - 1), value)
+            return
+        if first_bit:
+            self._set_mask(first_word, self._WORD_MASK ^ ((1 << first_bit) - 1), value)
+            first_word += 1
+        # Whole words in the middle are written with one slice assignment (a memset in C).
+        self._data[first_word:last_word] = _filled_array(
+            'Q', self._WORD_MASK if value else 0, last_word - first_word
+        )
+        if last_bit:
+            self._set_mask(last_word, (1 << last_bit) - 1, value)
 
     def count(self):
         """Return the number of bits set to True."""
-        return sum(bin(byte).count('1') for byte in self._data)
+        # Padding bits are always clear, so popcounting the raw buffer as one big int is exact
+        # (and independent of the words' byte order).
+        return int.from_bytes(self._data, 'little').bit_count()
 
     def __len__(self):
         return self._size
 
     def __repr__(self):
-        bits_str = ''.join(
-            '1' if self.get(i) else '0' for i in range(self._size)
-        )
+        # Format each 64-bit word at once; reversing puts its bit 0 first.
+        bits_str = ''.join(format(word, '064b')[::-1] for word in self._data)[:self._size]
         return f"BitArray({bits_str})"
 
 
@@ -683,7 +992,7 @@ class ColumnMajor2DArray:
         self._rows = rows
         self._cols = cols
         self._typecode = typecode
-        self._data = array(typecode, [fill_value] * (rows * cols))
+        self._data = _filled_array(typecode, fill_value, rows * cols)
 
     @property
     def shape(self):
@@ -716,18 +1025,28 @@ class ColumnMajor2DArray:
         """Get full row as a list."""
         if not 0 <= row < self._rows:
             raise IndexError("row index out of range")
-        return [self.get(row, c) for c in range(self._cols)]
+        # A row is every `rows`-th element starting at `row`: one strided C-level slice.
+        return list(self._data[row::self._rows])
 
     def __len__(self):
         return self._rows
 
     def __repr__(self):
-        rows_str = "\n".join(
-            str([self.get(r, c) for c in range(self._cols)])
-            for r in range(self._rows)
-        )
+        rows_str = _format_rows(lambda r: self._data[r::self._rows], self._rows, self._cols)
         return f"ColumnMajor2DArray({self._rows}x{self._cols}):\n{rows_str}"
 
+    def to_rowmajor(self):
+        """Return a TwoDArray (row-major) copy of this matrix."""
+        out = object.__new__(TwoDArray)
+        out._rows, out._cols, out._typecode = self._rows, self._cols, self._typecode
+        out._data = array(self._typecode, self._data)  # same size and typecode; overwritten below
+        # Each contiguous source column is scattered into the destination with one strided
+        # slice assignment, so the transpose runs in C rather than element by element.
+        rows, cols = self._rows, self._cols
+        for c in range(cols):
+            out._data[c::cols] = self._data[c * rows:(c + 1) * rows]
+        return out
+
 
 class ImmutableArray:
     """
@@ -777,7 +1096,7 @@ class ImmutableArray:
         return iter(self._data)
 
     def __repr__(self):
-        return f"ImmutableArray({list(self._data)})"
+        return f"ImmutableArray({_format_items(self._data, len(self._data))})"
 
     def __setitem__(self, index, value):
         raise TypeError("ImmutableArray does not support item assignment")
@@ -8,11 +8,87 @@ Implements:
     - DAryHeap
 
 All heaps are implemented using arrays (Python lists) for efficiency.
+MinHeap delegates to the C-implemented ``heapq`` module (or, when built
+with an ``array`` typecode, to equivalent pure-Python sifts); MaxHeap and
+DAryHeap work on arbitrary comparable values, which ``heapq`` cannot
+order in reverse or with d > 2, so they keep their own sift routines.
 """
 
+import heapq
+from array import array
+
+
+# Pure-Python counterparts of the heapq functions, used by MinHeap when the heap is an
+# array.array (heapq only accepts lists). Same hole-based bottom-up sifts as MaxHeap.
+def _array_siftup(heap, index, start=0):
+    value = heap[index]
+    while index > start:
+        parent = (index - 1) >> 1
+        if not value < heap[parent]:
+            break
+        heap[index] = heap[parent]
+        index = parent
+    heap[index] = value
+
+
+def _array_siftdown(heap, index):
+    end = len(heap)
+    start = index
+    value = heap[index]
+    child = 2 * index + 1
+    while child < end:
+        right = child + 1
+        if right < end and heap[right] < heap[child]:
+            child = right
+        heap[index] = heap[child]
+        index = child
+        child = 2 * index + 1
+    heap[index] = value
+    _array_siftup(heap, index, start)
+
+
+def _array_heappush(heap, value):
+    heap.append(value)
+    _array_siftup(heap, len(heap) - 1)
+
+
+def _array_heappop(heap):
+    last = heap.pop()
+    if not heap:
+        return last
+    min_value = heap[0]
+    heap[0] = last
+    _array_siftdown(heap, 0)
+    return min_value
+
+
+def _array_heappushpop(heap, value):
+    if heap and heap[0] < value:
+        value, heap[0] = heap[0], value
+        _array_siftdown(heap, 0)
+    return value
+
+
+def _array_heapreplace(heap, value):
+    min_value = heap[0]
+    heap[0] = value
+    _array_siftdown(heap, 0)
+    return min_value
+
+
+def _array_heapify(heap):
+    for i in reversed(range(len(heap) // 2)):
+        _array_siftdown(heap, i)
+
+
 class MinHeap:
     """
     MinHeap — Binary Heap where the smallest element is always at the root.
+
+    ``self.heap`` is a plain list kept in ``heapq`` order, so the sift loops run in C.
+    Pass an ``array`` typecode (e.g. ``'q'`` or ``'d'``) to store numbers unboxed in an
+    ``array.array`` instead: 8 bytes per item rather than a full Python object, at the
+    cost of pure-Python sift loops.
     
     Use Case:
         Priority scheduling systems where the smallest value should be processed first.
@@ -22,11 +98,29 @@ class MinHeap:
         extract_min()     → Remove and return the smallest element.
         peek_min()        → Return smallest element without removing.
         build_heap(data)  → Build heap from iterable.
+        insert_many(data) → Add many elements, re-heapifying in O(n) when that is cheaper.
+        pushpop(value)    → Insert then extract the smallest, with a single sift.
+        replace(value)    → Extract the smallest then insert, with a single sift.
         is_empty()        → Return True if heap is empty.
         to_list()         → Return heap elements as a list.
     """
-    def __init__(self):
-        self.heap = []
+    _push = staticmethod(heapq.heappush)
+    _pop = staticmethod(heapq.heappop)
+    _pushpop = staticmethod(heapq.heappushpop)
+    _replace = staticmethod(heapq.heapreplace)
+    _heapify = staticmethod(heapq.heapify)
+
+    def __init__(self, typecode=None):
+        self.typecode = typecode
+        if typecode is None:
+            self.heap = []
+        else:
+            self.heap = array(typecode)
+            self._push = _array_heappush
+            self._pop = _array_heappop
+            self._pushpop = _array_heappushpop
+            self._replace = _array_heapreplace
+            self._heapify = _array_heapify
 
     def is_empty(self):
         return len(self.heap) == 0
@@ -40,43 +134,49 @@ class MinHeap:
         return self.heap[0]
 
     def insert(self, value):
-        self.heap.append(value)
-        self._heapify_up(len(self.heap) - 1)
+        self._push(self.heap, value)
 
     def extract_min(self):
         if not self.heap:
             raise IndexError("Heap is empty")
-        self._swap(0, len(self.heap) - 1)
-        min_value = self.heap.pop()
-        self._heapify_down(0)
-        return min_value
+        return self._pop(self.heap)
 
-    def build_heap(self, iterable):
-        self.heap = list(iterable)
-        for i in reversed(range(len(self.heap) // 2)):
-            self._heapify_down(i)
-
-    def _heapify_up(self, index):
-        parent = (index - 1) // 2
-        while index > 0 and self.heap[index] < self.heap[parent]:
-            self._swap(index, parent)
-            index = parent
-            parent = (index - 1) // 2
+    def pushpop(self, value):
+        return self._pushpop(self.heap, value)
 
-    def _heapify_down(self, index):
-        smallest = index
-        left = 2 * index + 1
-        right = 2 * index + 2
-        if left < len(self.heap) and self.heap[left] < self.heap[smallest]:
-            smallest = left
-        if right < len(self.heap) and self.heap[right] < self.heap[smallest]:
-            smallest = right
-        if smallest != index:
-            self._swap(index, smallest)
-            self._heapify_down(smallest)
+    def replace(self, value):
+        if not self.heap:
+            raise IndexError("Heap is empty")
+        return self._replace(self.heap, value)
+
+    def _items(self, iterable):
+        """Copy iterable into a new list or array of the heap's typecode."""
+        if self.typecode is None:
+            return list(iterable)
+        if isinstance(iterable, array) and iterable.typecode != self.typecode:
+            iterable = iterable.tolist()  # extend() only takes same-typecode arrays
+        items = array(self.typecode)
+        # extend() takes bytes-like input item by item, where array(typecode, x)
+        # would read it as raw machine data; a bad value raises before the heap changes.
+        items.extend(iterable)
+        return items
 
-    def _swap(self, i, j):
-        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+    def build_heap(self, iterable):
+        self.heap = self._items(iterable)
+        self._heapify(self.heap)
+
+    def insert_many(self, iterable):
+        heap = self.heap
+        items = self._items(iterable)
+        # A push per item costs O(k log n); once the batch outnumbers the heap,
+        # one O(n + k) heapify of everything is cheaper.
+        if len(items) >= len(heap):
+            heap.extend(items)
+            self._heapify(heap)
+        else:
+            push = self._push
+            for value in items:
+                push(heap, value)
 
 
 class MaxHeap:
@@ -107,8 +207,29 @@ class MaxHeap:
     def extract_max(self):
         if not self.heap:
             raise IndexError("Heap is empty")
-        self._swap(0, len(self.heap) - 1)
-        max_value = self.heap.pop()
+        last = self.heap.pop()
+        if not self.heap:
+            return last
+        max_value = self.heap[0]
+        self.heap[0] = last
+        self._heapify_down(0)
+        return max_value
+
+    def pushpop(self, value):
+        """Insert value then extract the max; one sift instead of two."""
+        heap = self.heap
+        if heap and heap[0] > value:
+            value, heap[0] = heap[0], value
+            self._heapify_down(0)
+        return value
+
+    def replace(self, value):
+        """Extract the max then insert value; one sift instead of two."""
+        heap = self.heap
+        if not heap:
+            raise IndexError("Heap is empty")
+        max_value = heap[0]
+        heap[0] = value
         self._heapify_down(0)
         return max_value
 
@@ -117,27 +238,49 @@ class MaxHeap:
         for i in reversed(range(len(self.heap) // 2)):
             self._heapify_down(i)
 
-    def _heapify_up(self, index):
-        parent = (index - 1) // 2
-        while index > 0 and self.heap[index] > self.heap[parent]:
-            self._swap(index, parent)
+    def insert_many(self, iterable):
+        heap = self.heap
+        n = len(heap)
+        heap.extend(iterable)
+        if len(heap) - n >= n:
+            # The batch outnumbers the old heap: one O(n + k) rebuild beats k sift-ups.
+            for i in reversed(range(len(heap) // 2)):
+                self._heapify_down(i)
+        else:
+            for i in range(n, len(heap)):
+                self._heapify_up(i)
+
+    # The sift loops move a "hole" instead of swapping: smaller parents (or larger children)
+    # are shifted into it and the value is written once at its final slot.
+    def _heapify_up(self, index, start=0):
+        heap = self.heap
+        value = heap[index]
+        while index > start:
+            parent = (index - 1) >> 1
+            if not value > heap[parent]:
+                break
+            heap[index] = heap[parent]
             index = parent
-            parent = (index - 1) // 2
+        heap[index] = value
 
     def _heapify_down(self, index):
-        largest = index
-        left = 2 * index + 1
-        right = 2 * index + 2
-        if left < len(self.heap) and self.heap[left] > self.heap[largest]:
-            largest = left
-        if right < len(self.heap) and self.heap[right] > self.heap[largest]:
-            largest = right
-        if largest != index:
-            self._swap(index, largest)
-            self._heapify_down(largest)
-
-    def _swap(self, i, j):
-        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        # Bottom-up sift: promote the larger child down to a leaf, then sift the value back up.
+        heap = self.heap
+        end = len(heap)
+        if index >= end:
+            return
+        start = index
+        value = heap[index]
+        child = 2 * index + 1
+        while child < end:
+            right = child + 1
+            if right < end and heap[right] > heap[child]:
+                child = right
+            heap[index] = heap[child]
+            index = child
+            child = 2 * index + 1
+        heap[index] = value
+        self._heapify_up(index, start)
 
 
 class DAryHeap:
@@ -173,35 +316,88 @@ class DAryHeap:
     def extract_min(self):
         if not self.heap:
             raise IndexError("Heap is empty")
-        self._swap(0, len(self.heap) - 1)
-        min_value = self.heap.pop()
+        last = self.heap.pop()
+        if not self.heap:
+            return last
+        min_value = self.heap[0]
+        self.heap[0] = last
+        self._heapify_down(0)
+        return min_value
+
+    def pushpop(self, value):
+        """Insert value then extract the min; one sift instead of two."""
+        heap = self.heap
+        if heap and heap[0] < value:
+            value, heap[0] = heap[0], value
+            self._heapify_down(0)
+        return value
+
+    def replace(self, value):
+        """Extract the min then insert value; one sift instead of two."""
+        heap = self.heap
+        if not heap:
+            raise IndexError("Heap is empty")
+        min_value = heap[0]
+        heap[0] = value
         self._heapify_down(0)
         return min_value
 
     def build_heap(self, iterable):
         self.heap = list(iterable)
-        for i in reversed(range(len(self.heap) // self.d + 1)):
+        # Only internal nodes need sifting; the last one is the parent of the last element.
+        for i in reversed(range((len(self.heap) - 2) // self.d + 1)):
             self._heapify_down(i)
 
-    def _heapify_up(self, index):
-        parent = (index - 1) // self.d
-        while index > 0 and self.heap[index] < self.heap[parent]:
-            self._swap(index, parent)
+    def insert_many(self, iterable):
+        heap = self.heap
+        n = len(heap)
+        heap.extend(iterable)
+        if len(heap) - n >= n:
+            # As in MaxHeap.insert_many: rebuild when the batch outnumbers the old heap.
+            for i in reversed(range((len(heap) - 2) // self.d + 1)):
+                self._heapify_down(i)
+        else:
+            for i in range(n, len(heap)):
+                self._heapify_up(i)
+
+    # Hole-based sifts, as in MaxHeap: shift entries into the hole and write the value once.
+    def _heapify_up(self, index, start=0):
+        heap = self.heap
+        d = self.d
+        value = heap[index]
+        while index > start:
+            parent = (index - 1) // d
+            if not value < heap[parent]:
+                break
+            heap[index] = heap[parent]
             index = parent
-            parent = (index - 1) // self.d
+        heap[index] = value
 
     def _heapify_down(self, index):
-        smallest = index
-        for k in range(1, self.d + 1):
-            child = self.d * index + k
-            if child < len(self.heap) and self.heap[child] < self.heap[smallest]:
+        # Bottom-up sift: promote the smallest child down to a leaf, then sift the value back up.
+        heap = self.heap
+        d = self.d
+        end = len(heap)
+        if index >= end:
+            return
+        start = index
+        value = heap[index]
+        child = d * index + 1
+        while child < end:
+            if d == 2:
+                smallest = child + 1 if child + 1 < end and heap[child + 1] < heap[child] else child
+            else:
                 smallest = child
-        if smallest != index:
-            self._swap(index, smallest)
-            self._heapify_down(smallest)
-
-    def _swap(self, i, j):
-        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+                best = heap[child]
+                for c in range(child + 1, min(child + d, end)):
+                    if heap[c] < best:
+                        smallest = c
+                        best = heap[c]
+            heap[index] = heap[smallest]
+            index = smallest
+            child = d * index + 1
+        heap[index] = value
+        self._heapify_up(index, start)
 
 
 def real_world_examples():
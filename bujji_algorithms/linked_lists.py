@@ -1,4 +1,5 @@
 import random
+from array import array
 
 class SinglyNode:
     """Node for Singly Linked List."""
@@ -41,6 +42,16 @@ class SinglyLinkedList:
     Each node contains a value and a pointer to the next node.
     Supports efficient appends, prepends, and traversal.
 
+    Nodes live in an arena rather than as separate objects: slot ``i`` holds
+    ``_values[i]`` and the slot index of its successor in ``_next[i]`` (an
+    ``array('q')``, -1 for the end of the list). Removed slots go onto a free
+    list and are reused by later inserts. Each node costs two machine words
+    instead of a Python object, and a walk hops through two contiguous buffers.
+
+    Because there are no node objects, this list has no public ``head``/``tail``
+    nodes to walk, and ``find`` returns an index (or None) rather than a node.
+    Iterate the list, or use ``index_of``/``insert``/``remove``, instead.
+
     Usage:
     >>> sll = SinglyLinkedList()
     >>> sll.append(1)
@@ -57,28 +68,72 @@ class SinglyLinkedList:
     """
 
     def __init__(self):
-        self.head = None
-        self.tail = None
+        self._values = []
+        self._next = array('q')
+        self._free = []
+        self._head = -1
+        self._tail = -1
         self.length = 0
 
+    def _alloc(self, value):
+        """Return a slot holding value with no successor, reusing a freed slot if any."""
+        if self._free:
+            slot = self._free.pop()
+            self._values[slot] = value
+            self._next[slot] = -1
+        else:
+            slot = len(self._values)
+            self._values.append(value)
+            self._next.append(-1)
+        return slot
+
+    def _release(self, slot):
+        self._values[slot] = None  # drop the reference so the value can be collected
+        self._free.append(slot)
+
     def append(self, value):
         """Add value at the end."""
-        new_node = SinglyNode(value)
-        if not self.head:
-            self.head = self.tail = new_node
+        slot = self._alloc(value)
+        if self._head == -1:
+            self._head = slot
         else:
-            self.tail.next = new_node
-            self.tail = new_node
+            self._next[self._tail] = slot
+        self._tail = slot
         self.length += 1
 
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Create a list holding the values of iterable, linked in one bulk extend()."""
+        lst = cls()
+        lst.extend(iterable)
+        return lst
+
+    def extend(self, iterable):
+        """Append every value from iterable, linking the new slots in one pass."""
+        values = self._values
+        start = len(values)
+        values.extend(iterable)
+        count = len(values) - start
+        if not count:
+            return
+        # New slots are contiguous, so each one's successor is simply the next slot.
+        self._next.extend(range(start + 1, start + count + 1))
+        self._next[-1] = -1
+        if self._head == -1:
+            self._head = start
+        else:
+            self._next[self._tail] = start
+        self._tail = start + count - 1
+        self.length += count
+
     def prepend(self, value):
         """Add value at the start."""
-        new_node = SinglyNode(value)
-        if not self.head:
-            self.head = self.tail = new_node
+        slot = self._alloc(value)
+        if self._head == -1:
+            self._tail = slot
         else:
-            new_node.next = self.head
-            self.head = new_node
+            self._next[slot] = self._head
+        self._head = slot
         self.length += 1
 
     def insert(self, index, value):
@@ -91,49 +146,66 @@ class SinglyLinkedList:
         if index == self.length:
             self.append(value)
             return
-        new_node = SinglyNode(value)
-        current = self.head
+        nxt = self._next
+        current = self._head
         for _ in range(index - 1):
-            current = current.next
-        new_node.next = current.next
-        current.next = new_node
+            current = nxt[current]
+        slot = self._alloc(value)
+        nxt[slot] = nxt[current]
+        nxt[current] = slot
         self.length += 1
 
     def remove(self, value):
         """Remove first node with the given value. Returns True if removed."""
-        if not self.head:
+        if self._head == -1:
             raise ValueError("List is empty")
-        current = self.head
-        prev = None
-        while current:
-            if current.value == value:
-                if prev is None:
-                    self.head = current.next
-                    if current == self.tail:
-                        self.tail = None
+        values, nxt = self._values, self._next
+        current = self._head
+        prev = -1
+        while current != -1:
+            if values[current] == value:
+                if prev == -1:
+                    self._head = nxt[current]
                 else:
-                    prev.next = current.next
-                    if current == self.tail:
-                        self.tail = prev
+                    nxt[prev] = nxt[current]
+                if current == self._tail:
+                    self._tail = prev
+                self._release(current)
                 self.length -= 1
                 return True
             prev = current
-            current = current.next
+            current = nxt[current]
         raise ValueError(f"Value {value} not found")
 
-    def find(self, value):
-        """Return the first node with the given value or None."""
-        current = self.head
-        while current:
-            if current.value == value:
-                return current
-            current = current.next
+    def index_of(self, value):
+        """Return the index of the first node with the given value or None."""
+        values, nxt = self._values, self._next
+        current = self._head
+        index = 0
+        while current != -1:
+            if values[current] == value:
+                return index
+            current = nxt[current]
+            index += 1
         return None
 
+    def find(self, value):
+        """
+        Return the index of the first node with the given value or None.
+
+        Same as ``index_of``. Nodes are arena slots, not objects, so unlike the
+        other lists this returns a position rather than a node; compare the
+        result with ``is None``, since index 0 is a hit.
+        """
+        return self.index_of(value)
+
     def clear(self):
         """Clear the list."""
-        self.head = None
-        self.tail = None
+        self._values = []
+        self._next = array('q')
+        self._free = []
+        self._head = -1
+        self._tail = -1
         self.length = 0
 
     def to_list(self):
@@ -142,19 +214,20 @@ class SinglyLinkedList:
 
     def display(self):
         """Print the list values in readable format."""
-        values = []
-        current = self.head
-        while current:
-            values.append(str(current.value))
-            current = current.next
-        print(" -> ".join(values) + " -> None")
+        # print() streams each item to stdout, so no joined string or list of strs is built.
+        print(*self, sep=" -> ", end=" -> None\n")
 
     def __iter__(self):
         """Iterator over values."""
-        current = self.head
-        while current:
-            yield current.value
-            current = current.next
+        values, nxt = self._values, self._next
+        current = self._head
+        while current != -1:
+            yield values[current]
+            current = nxt[current]
+
+    def __contains__(self, value):
+        """Return True if value is in the list, stopping at the first match."""
+        return self.index_of(value) is not None
 
     def __len__(self):
         """Return length of the list."""
@@ -210,6 +283,31 @@ class DoublyLinkedList:
             self.tail = new_node
         self.length += 1
 
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Create a list holding the values of iterable, linked in one bulk extend()."""
+        lst = cls()
+        lst.extend(iterable)
+        return lst
+
+    def extend(self, iterable):
+        """Append every value from iterable in a single walk."""
+        if iterable is self:
+            iterable = list(iterable)
+        tail = self.tail
+        count = 0
+        for value in iterable:
+            node = DoublyNode(value)
+            node.prev = tail
+            if tail is None:
+                self.head = node
+            else:
+                tail.next = node
+            tail = node
+            count += 1
+        self.tail = tail
+        self.length += count
+
     def prepend(self, value):
         """Add value at the start."""
         new_node = DoublyNode(value)
@@ -232,9 +330,15 @@ class DoublyLinkedList:
             self.append(value)
             return
         new_node = DoublyNode(value)
-        current = self.head
-        for _ in range(index):
-            current = current.next
+        # Walk from whichever end is closer to the node currently at `index`.
+        if index <= self.length // 2:
+            current = self.head
+            for _ in range(index):
+                current = current.next
+        else:
+            current = self.tail
+            for _ in range(self.length - 1 - index):
+                current = current.prev
         prev_node = current.prev
         prev_node.next = new_node
         new_node.prev = prev_node
@@ -281,12 +385,7 @@ class DoublyLinkedList:
 
     def display(self):
         """Print the list values in readable format."""
-        values = []
-        current = self.head
-        while current:
-            values.append(str(current.value))
-            current = current.next
-        print(" <-> ".join(values) + " <-> None")
+        print(*self, sep=" <-> ", end=" <-> None\n")
 
     def __iter__(self):
         """Iterator over values forward."""
@@ -302,6 +401,10 @@ class DoublyLinkedList:
             yield current.value
             current = current.prev
 
+    def __contains__(self, value):
+        """Return True if value is in the list, stopping at the first match."""
+        return self.find(value) is not None
+
     def __len__(self):
         """Return length of the list."""
         return self.length
@@ -345,6 +448,33 @@ class CircularSinglyLinkedList:
             self.tail = new_node
         self.length += 1
 
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Create a list holding the values of iterable, linked in one bulk extend()."""
+        lst = cls()
+        lst.extend(iterable)
+        return lst
+
+    def extend(self, iterable):
+        """Append every value from iterable, closing the circle once at the end."""
+        if iterable is self:
+            iterable = list(iterable)
+        tail = self.tail
+        head = tail.next if tail else None
+        count = 0
+        for value in iterable:
+            node = SinglyNode(value)
+            if tail is None:
+                head = node
+            else:
+                tail.next = node
+            tail = node
+            count += 1
+        if count:
+            tail.next = head
+            self.tail = tail
+            self.length += count
+
     def prepend(self, value):
         """Add value at the start."""
         new_node = SinglyNode(value)
@@ -360,9 +490,9 @@ class CircularSinglyLinkedList:
         """Remove first node with the given value. Returns True if removed."""
         if not self.tail:
             raise ValueError("List is empty")
-        current = self.tail.next
+        head = current = self.tail.next
         prev = self.tail
-        for _ in range(self.length):
+        while True:
             if current.value == value:
                 if self.length == 1:
                     self.tail = None
@@ -374,18 +504,23 @@ class CircularSinglyLinkedList:
                 return True
             prev = current
             current = current.next
+            if current is head:
+                break
         raise ValueError(f"Value {value} not found")
 
     def find(self, value):
         """Return the first node with the given value or None."""
         if not self.tail:
             return None
-        current = self.tail.next
-        for _ in range(self.length):
+        # Walk until we are back at the head: an identity check per step is cheaper
+        # than driving a range(self.length) counter.
+        head = current = self.tail.next
+        while True:
             if current.value == value:
                 return current
             current = current.next
-        return None
+            if current is head:
+                return None
 
     def clear(self):
         """Clear the list."""
@@ -401,21 +536,22 @@ class CircularSinglyLinkedList:
         if not self.tail:
             print("Empty list")
             return
-        values = []
-        current = self.tail.next
-        for _ in range(self.length):
-            values.append(str(current.value))
-            current = current.next
-        print(" -> ".join(values) + " -> (back to head)")
+        print(*self, sep=" -> ", end=" -> (back to head)\n")
 
     def __iter__(self):
         """Iterator over values once around the circle."""
         if not self.tail:
             return
-        current = self.tail.next
-        for _ in range(self.length):
+        head = current = self.tail.next
+        while True:
             yield current.value
             current = current.next
+            if current is head:
+                return
+
+    def __contains__(self, value):
+        """Return True if value is in the list, stopping at the first match."""
+        return self.find(value) is not None
 
     def __len__(self):
         """Return length of the list."""
@@ -466,6 +602,35 @@ class CircularDoublyLinkedList:
             self.tail = new_node
         self.length += 1
 
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Create a list holding the values of iterable, linked in one bulk extend()."""
+        lst = cls()
+        lst.extend(iterable)
+        return lst
+
+    def extend(self, iterable):
+        """Append every value from iterable, closing the circle once at the end."""
+        if iterable is self:
+            iterable = list(iterable)
+        tail = self.tail
+        head = tail.next if tail else None
+        count = 0
+        for value in iterable:
+            node = DoublyNode(value)
+            node.prev = tail
+            if tail is None:
+                head = node
+            else:
+                tail.next = node
+            tail = node
+            count += 1
+        if count:
+            tail.next = head
+            head.prev = tail
+            self.tail = tail
+            self.length += count
+
     def prepend(self, value):
         """Add value at the start."""
         new_node = DoublyNode(value)
@@ -484,8 +649,8 @@ class CircularDoublyLinkedList:
         """Remove first node with the given value. Returns True if removed."""
         if not self.tail:
             raise ValueError("List is empty")
-        current = self.tail.next
-        for _ in range(self.length):
+        head = current = self.tail.next
+        while True:
             if current.value == value:
                 if self.length == 1:
                     self.tail = None
@@ -497,18 +662,21 @@ class CircularDoublyLinkedList:
                 self.length -= 1
                 return True
             current = current.next
+            if current is head:
+                break
         raise ValueError(f"Value {value} not found")
 
     def find(self, value):
         """Return the first node with the given value or None."""
         if not self.tail:
             return None
-        current = self.tail.next
-        for _ in range(self.length):
+        head = current = self.tail.next
+        while True:
             if current.value == value:
                 return current
             current = current.next
-        return None
+            if current is head:
+                return None
 
     def clear(self):
         """Clear the list."""
@@ -524,30 +692,33 @@ class CircularDoublyLinkedList:
         if not self.tail:
             print("Empty list")
             return
-        values = []
-        current = self.tail.next
-        for _ in range(self.length):
-            values.append(str(current.value))
-            current = current.next
-        print(" <-> ".join(values) + " <-> (back to head)")
+        print(*self, sep=" <-> ", end=" <-> (back to head)\n")
 
     def __iter__(self):
         """Iterator over values forwards once around the circle."""
         if not self.tail:
             return
-        current = self.tail.next
-        for _ in range(self.length):
+        head = current = self.tail.next
+        while True:
             yield current.value
             current = current.next
+            if current is head:
+                return
 
     def __reversed__(self):
         """Iterator over values backwards once around the circle."""
         if not self.tail:
             return
-        current = self.tail
-        for _ in range(self.length):
+        tail = current = self.tail
+        while True:
             yield current.value
             current = current.prev
+            if current is tail:
+                return
+
+    def __contains__(self, value):
+        """Return True if value is in the list, stopping at the first match."""
+        return self.find(value) is not None
 
     def __len__(self):
         """Return length of the list."""
@@ -585,22 +756,49 @@ class SkipList:
         self.header = SkipListNode(None, self.max_level)
         self.level = 0
         self.length = 0
+        self._free = [[] for _ in range(max_level + 1)]  # recycled nodes, bucketed by level
+        # Scratch predecessor buffer shared by insert/remove; each op only reads the
+        # slots it has just written, so it never needs resetting.
+        self._update = [self.header] * (max_level + 1)
+
+    def _alloc(self, value, lvl):
+        """Return a node of level lvl, recycled from a removed node when possible."""
+        bucket = self._free[lvl]
+        if bucket:
+            node = bucket.pop()
+            node.value = value
+            return node
+        return SkipListNode(value, lvl)
+
+    def _release(self, node):
+        node.value = None
+        forwards = node.forwards
+        for i in range(len(forwards)):
+            forwards[i] = None
+        self._free[len(forwards) - 1].append(node)
 
     def random_level(self):
+        if self.p == 0.5:
+            # Each level is a fair coin flip, so the level is the number of trailing zero
+            # bits of a random max_level-bit word (all zeros means max_level).
+            bits = random.getrandbits(self.max_level)
+            return (bits & -bits).bit_length() - 1 if bits else self.max_level
         lvl = 0
         while random.random() < self.p and lvl < self.max_level:
             lvl += 1
         return lvl
 
     def insert(self, value):
-        update = [None] * (self.max_level + 1)
+        update = self._update
         current = self.header
         for i in reversed(range(self.level + 1)):
-            while current.forwards[i] and current.forwards[i].value < value:
-                current = current.forwards[i]
+            nxt = current.forwards[i]
+            while nxt is not None and nxt.value < value:
+                current = nxt
+                nxt = current.forwards[i]
             update[i] = current
 
-        current = current.forwards[0]
+        current = nxt  # successor at level 0
 
         if current is None or current.value != value:
             lvl = self.random_level()
@@ -608,21 +806,23 @@ class SkipList:
                 for i in range(self.level + 1, lvl + 1):
                     update[i] = self.header
                 self.level = lvl
-            new_node = SkipListNode(value, lvl)
+            new_node = self._alloc(value, lvl)
             for i in range(lvl + 1):
                 new_node.forwards[i] = update[i].forwards[i]
                 update[i].forwards[i] = new_node
             self.length += 1
 
     def remove(self, value):
-        update = [None] * (self.max_level + 1)
+        update = self._update
         current = self.header
         for i in reversed(range(self.level + 1)):
-            while current.forwards[i] and current.forwards[i].value < value:
-                current = current.forwards[i]
+            nxt = current.forwards[i]
+            while nxt is not None and nxt.value < value:
+                current = nxt
+                nxt = current.forwards[i]
             update[i] = current
 
-        current = current.forwards[0]
+        current = nxt  # successor at level 0
 
         if current and current.value == value:
             for i in range(self.level + 1):
@@ -632,16 +832,20 @@ class SkipList:
 
             while self.level > 0 and self.header.forwards[self.level] is None:
                 self.level -= 1
+            self._release(current)
             self.length -= 1
             return True
         return False
 
     def search(self, value):
         current = self.header
+        # Each step loads the next node once and reuses it, rather than re-indexing forwards[i].
         for i in reversed(range(self.level + 1)):
-            while current.forwards[i] and current.forwards[i].value < value:
-                current = current.forwards[i]
-        current = current.forwards[0]
+            nxt = current.forwards[i]
+            while nxt is not None and nxt.value < value:
+                current = nxt
+                nxt = current.forwards[i]
+        current = nxt
         if current and current.value == value:
             return current
         return None
@@ -650,6 +854,7 @@ class SkipList:
         self.header = SkipListNode(None, self.max_level)
         self.level = 0
         self.length = 0
+        self._free = [[] for _ in range(self.max_level + 1)]
 
     def display(self):
         print("SkipList Levels:")
@@ -671,6 +876,21 @@ class SkipList:
             yield current.value
             current = current.forwards[0]
 
+    def __contains__(self, value):
+        """Return True if value is stored; stops at whichever level first reaches it."""
+        current = self.header
+        for i in reversed(range(self.level + 1)):
+            nxt = current.forwards[i]
+            while nxt is not None:
+                key = nxt.value
+                if not key < value:
+                    if key == value:
+                        return True
+                    break
+                current = nxt
+                nxt = current.forwards[i]
+        return False
+
     def __len__(self):
         return self.length
 
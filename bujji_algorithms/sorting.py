@@ -1,3 +1,9 @@
+import heapq
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+
+
 def bubble_sort(arr):
     """
     Bubble Sort Algorithm
@@ -15,15 +21,22 @@ def bubble_sort(arr):
     >>> bubble_sort([5, 3, 8, 4, 2])
     [2, 3, 4, 5, 8]
     """
-    n = len(arr)
-    for i in range(n):
-        swapped = False
-        for j in range(0, n - 1 - i):
-            if arr[j] > arr[j + 1]:
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                swapped = True
-        if not swapped:
-            break
+    # The bubbling element is carried in a local instead of being re-read from the
+    # list, and each pass stops where the previous pass made its last swap.
+    end = len(arr) - 1
+    while end > 0:
+        last_swap = 0
+        current = arr[0]
+        for j in range(end):
+            following = arr[j + 1]
+            if current > following:
+                arr[j] = following
+                last_swap = j
+            else:
+                arr[j] = current
+                current = following
+        arr[end] = current
+        end = last_swap
     return arr
 
 
@@ -47,11 +60,13 @@ def selection_sort(arr):
     n = len(arr)
     for i in range(n):
         min_idx = i
+        min_val = arr[i]  # compare against a local, not arr[min_idx]
         for j in range(i+1, n):
-            if arr[j] < arr[min_idx]:
+            if arr[j] < min_val:
                 min_idx = j
+                min_val = arr[j]
         if min_idx != i:
-            arr[i], arr[min_idx] = arr[min_idx], arr[i]
+            arr[i], arr[min_idx] = min_val, arr[i]
     return arr
 
 
@@ -62,7 +77,12 @@ def insertion_sort(arr):
     Builds the sorted array one element at a time by inserting each element
     into its proper place in the already sorted portion.
     
-    Time Complexity: O(n^2) worst, O(n) best (nearly sorted)
+    The insertion point is found by binary search (``bisect_right``, which
+    keeps equal elements in order) and the sorted run is shifted with one
+    slice assignment, so each element costs O(log k) comparisons rather
+    than O(k) for a displacement of k.
+    
+    Time Complexity: O(n^2) worst (element moves), O(n) best (nearly sorted)
     Space Complexity: O(1)
     Stability: Stable
     
@@ -74,22 +94,152 @@ def insertion_sort(arr):
     """
     for i in range(1, len(arr)):
         key = arr[i]
-        j = i-1
-        while j >= 0 and arr[j] > key:
-            arr[j+1] = arr[j]
-            j -= 1
-        arr[j+1] = key
+        if not key < arr[i-1]:
+            continue
+        pos = bisect_right(arr, key, 0, i)
+        arr[pos+1:i+1] = arr[pos:i]
+        arr[pos] = key
     return arr
 
 
-def merge_sort(arr):
+# merge_sort only farms work out to processes above this size; below it the
+# pickling and process start-up cost more than the sort itself.
+_PARALLEL_THRESHOLD = 1 << 15
+
+# merge_sort leaves at or below this length are insertion-sorted in place
+# instead of being split down to single elements.
+_MERGE_LEAF = 32
+
+
+def _merge(left, right):
+    """Stable merge of two sorted lists (ties taken from left)."""
+    merged = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if left[i] <= right[j]:
+            merged.append(left[i])
+            i += 1
+        else:
+            merged.append(right[j])
+            j += 1
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+    return merged
+
+
+def _natural_runs(arr, limit):
+    """
+    Split arr into its ascending runs (strictly descending runs are copied
+    reversed, which keeps the split stable). Returns None as soon as more
+    than limit runs are found, so unstructured input costs only a short scan.
+    """
+    runs = []
+    n = len(arr)
+    i = 0
+    while i < n:
+        if len(runs) == limit:
+            return None
+        j = i + 1
+        if j < n and arr[j] < arr[i]:
+            while j + 1 < n and arr[j + 1] < arr[j]:
+                j += 1
+            j += 1
+            run = arr[i:j]
+            run.reverse()
+        else:
+            while j < n and not arr[j] < arr[j - 1]:
+                j += 1
+            run = arr[i:j]
+        runs.append(run)
+        i = j
+    return runs
+
+
+def _merge_runs(runs):
+    """
+    Merge adjacent sorted runs Timsort-style: keep a stack whose run lengths
+    shrink faster than Fibonacci (A > B + C, B > C) so merges stay balanced.
+    """
+    stack = []
+    for run in runs:
+        stack.append(run)
+        while len(stack) > 1:
+            if len(stack) > 2 and len(stack[-3]) <= len(stack[-2]) + len(stack[-1]):
+                if len(stack[-3]) < len(stack[-1]):
+                    stack[-3:-1] = [_merge(stack[-3], stack[-2])]
+                else:
+                    stack[-2:] = [_merge(stack[-2], stack[-1])]
+            elif len(stack[-2]) <= len(stack[-1]):
+                stack[-2:] = [_merge(stack[-2], stack[-1])]
+            else:
+                break
+    while len(stack) > 1:
+        stack[-2:] = [_merge(stack[-2], stack[-1])]
+    return stack[0] if stack else []
+
+
+def _merge_sort_halves(src, dst, lo, hi):
+    """
+    Sort dst[lo:hi] using src[lo:hi] (an identical copy) as scratch. The two
+    buffers swap roles at each level, so the whole sort allocates nothing
+    beyond the one copy made by merge_sort.
+    """
+    if hi - lo <= _MERGE_LEAF:
+        for i in range(lo + 1, hi):
+            key = dst[i]
+            j = i - 1
+            while j >= lo and key < dst[j]:
+                dst[j + 1] = dst[j]
+                j -= 1
+            dst[j + 1] = key
+        return
+    
+    mid = (lo + hi) // 2
+    # Sort both halves into src, then merge them back into dst.
+    _merge_sort_halves(dst, src, lo, mid)
+    _merge_sort_halves(dst, src, mid, hi)
+    i, j, k = lo, mid, lo
+    left, right = src[i], src[j]
+    while True:
+        if left <= right:
+            dst[k] = left
+            k += 1
+            i += 1
+            if i == mid:
+                dst[k:hi] = src[j:hi]
+                return
+            left = src[i]
+        else:
+            dst[k] = right
+            k += 1
+            j += 1
+            if j == hi:
+                dst[k:hi] = src[i:mid]
+                return
+            right = src[j]
+
+
+def merge_sort(arr, fast=False, workers=None):
     """
     Merge Sort Algorithm
     
     Divide-and-conquer algorithm that splits the array into halves,
     recursively sorts them, and merges sorted halves.
     
-    Time Complexity: O(n log n)
+    A first pass looks for natural ascending/descending runs; when the input
+    is made of few long runs they are merged directly (as Timsort does), so
+    already-sorted or reversed input costs a single O(n) scan.
+    
+    With ``fast=True`` the input is handed to the built-in ``sorted``
+    (CPython's Timsort, a C-level stable merge sort) instead of the
+    teaching implementation below.
+    
+    With ``workers=N`` (N > 1) and at least ``_PARALLEL_THRESHOLD`` items,
+    the input is split into N chunks that are merge-sorted in separate
+    processes, then merged pairwise here. Processes are used rather than
+    threads because the merge loop holds the GIL. Values must be picklable.
+    
+    Time Complexity: O(n log n), O(n) on presorted input
     Space Complexity: O(n)
     Stability: Stable
     
@@ -99,38 +249,48 @@ def merge_sort(arr):
     >>> merge_sort([12, 11, 13, 5, 6, 7])
     [5, 6, 7, 11, 12, 13]
     """
-    if len(arr) <= 1:
-        return arr
-    
-    def merge(left, right):
-        merged = []
-        i = j = 0
-        while i < len(left) and j < len(right):
-            if left[i] <= right[j]:
-                merged.append(left[i])
-                i += 1
-            else:
-                merged.append(right[j])
-                j += 1
-        merged.extend(left[i:])
-        merged.extend(right[j:])
-        return merged
-    
-    mid = len(arr) // 2
-    left = merge_sort(arr[:mid])
-    right = merge_sort(arr[mid:])
-    return merge(left, right)
-
-
-def quick_sort(arr, low=0, high=None):
+    if fast:
+        return sorted(arr)
+    if workers and workers > 1 and len(arr) >= _PARALLEL_THRESHOLD:
+        size = -(-len(arr) // workers)
+        chunks = [arr[i:i + size] for i in range(0, len(arr), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            runs = list(pool.map(merge_sort, chunks))
+        while len(runs) > 1:
+            # Merge neighbours in order so equal keys keep their original order.
+            runs = [_merge(runs[i], runs[i + 1]) if i + 1 < len(runs) else runs[i]
+                    for i in range(0, len(runs), 2)]
+        return runs[0]
+    # Work on a list copy: runs are reversed in place, and the result is
+    # always a new list whatever sequence type came in.
+    result = list(arr)
+    runs = _natural_runs(result, max(1, len(result) // _MERGE_LEAF))
+    if runs is not None:
+        return _merge_runs(runs)
+    _merge_sort_halves(result[:], result, 0, len(result))
+    return result
+
+
+# Ranges shorter than this are finished by insertion sort inside quick_sort.
+_INSERTION_CUTOFF = 16
+
+
+def quick_sort(arr, low=0, high=None, fast=False):
     """
     Quick Sort Algorithm
     
     Partition-based sort using a pivot element, recursively sorting
     elements less than and greater than pivot.
     
-    Time Complexity: O(n log n) average, O(n^2) worst
-    Space Complexity: O(log n) (recursive stack)
+    With ``fast=True`` the range is sorted in place by ``list.sort``
+    (Timsort in C) instead of the teaching implementation below.
+    
+    Implemented as introsort: median-of-three pivots, insertion sort for
+    ranges shorter than 16, and a heapsort fallback when partitioning goes
+    too deep, so already-sorted or adversarial inputs stay O(n log n).
+    
+    Time Complexity: O(n log n) average and worst
+    Space Complexity: O(log n) (explicit stack)
     Stability: Not stable
     
     Use case: General-purpose in-place sorting.
@@ -142,8 +302,55 @@ def quick_sort(arr, low=0, high=None):
     """
     if high is None:
         high = len(arr) - 1
+    if fast:
+        if low == 0 and high == len(arr) - 1:
+            arr.sort()
+        else:
+            arr[low:high + 1] = sorted(arr[low:high + 1])
+        return arr
     
+    def insertion(lo, hi):
+        for i in range(lo + 1, hi + 1):
+            key = arr[i]
+            j = i - 1
+            while j >= lo and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+
+    def heapsort_range(lo, hi):
+        # Same max-heap scheme as heap_sort, on arr[lo..hi] with offset indices.
+        def heapify(n, i):
+            while True:
+                largest = i
+                l = 2*i + 1
+                r = 2*i + 2
+                if l < n and arr[lo + l] > arr[lo + largest]:
+                    largest = l
+                if r < n and arr[lo + r] > arr[lo + largest]:
+                    largest = r
+                if largest == i:
+                    return
+                arr[lo + i], arr[lo + largest] = arr[lo + largest], arr[lo + i]
+                i = largest
+
+        n = hi - lo + 1
+        for i in range(n//2 - 1, -1, -1):
+            heapify(n, i)
+        for i in range(n-1, 0, -1):
+            arr[lo], arr[lo + i] = arr[lo + i], arr[lo]
+            heapify(i, 0)
+
     def partition(low, high):
+        # Median-of-three: order arr[low], arr[mid], arr[high], then use the median as pivot.
+        mid = (low + high) // 2
+        if arr[mid] < arr[low]:
+            arr[low], arr[mid] = arr[mid], arr[low]
+        if arr[high] < arr[low]:
+            arr[low], arr[high] = arr[high], arr[low]
+        if arr[high] < arr[mid]:
+            arr[mid], arr[high] = arr[high], arr[mid]
+        arr[mid], arr[high] = arr[high], arr[mid]
         pivot = arr[high]
         i = low - 1
         for j in range(low, high):
@@ -152,21 +359,41 @@ def quick_sort(arr, low=0, high=None):
                 arr[i], arr[j] = arr[j], arr[i]
         arr[i+1], arr[high] = arr[high], arr[i+1]
         return i + 1
-    
-    if low < high:
-        pi = partition(low, high)
-        quick_sort(arr, low, pi-1)
-        quick_sort(arr, pi+1, high)
+
+    # Introsort: quicksort on an explicit stack, insertion sort for short ranges, and
+    # heapsort once a range exceeds 2*log2(n) partitioning levels. The larger side
+    # is pushed and the smaller one is handled next, so the stack stays O(log n).
+    stack = [(low, high, 2 * max(high - low + 1, 1).bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo >= _INSERTION_CUTOFF:
+            if depth == 0:
+                heapsort_range(lo, hi)
+                break
+            depth -= 1
+            pi = partition(lo, hi)
+            if pi - lo < hi - pi:
+                stack.append((pi + 1, hi, depth))
+                hi = pi - 1
+            else:
+                stack.append((lo, pi - 1, depth))
+                lo = pi + 1
+        else:
+            insertion(lo, hi)
     return arr
 
 
-def heap_sort(arr):
+def heap_sort(arr, fast=False):
     """
     Heap Sort Algorithm
     
     Converts array into a max-heap and repeatedly extracts max element,
     sorting the array in-place.
     
+    With ``fast=True`` the heap work is done by the C-implemented ``heapq``
+    (heapify, then ``heappop`` until empty) and the result is written back
+    into ``arr``; this needs O(n) extra space for the output.
+    
     Time Complexity: O(n log n)
     Space Complexity: O(1)
     Stability: Not stable
@@ -177,19 +404,27 @@ def heap_sort(arr):
     >>> heap_sort([12, 11, 13, 5, 6, 7])
     [5, 6, 7, 11, 12, 13]
     """
+    if fast:
+        heapq.heapify(arr)
+        pop = heapq.heappop
+        arr[:] = [pop(arr) for _ in range(len(arr))]
+        return arr
+    
     def heapify(n, i):
-        largest = i
-        l = 2*i + 1
-        r = 2*i + 2
-        
-        if l < n and arr[l] > arr[largest]:
-            largest = l
-        if r < n and arr[r] > arr[largest]:
-            largest = r
-        
-        if largest != i:
-            arr[i], arr[largest] = arr[largest], arr[i]
-            heapify(n, largest)
+        # Iterative sift-down: carry the root value down through a hole and
+        # write it once, instead of swapping and recursing at every level.
+        value = arr[i]
+        child = 2*i + 1
+        while child < n:
+            right = child + 1
+            if right < n and arr[right] > arr[child]:
+                child = right
+            if not arr[child] > value:
+                break
+            arr[i] = arr[child]
+            i = child
+            child = 2*i + 1
+        arr[i] = value
     
     n = len(arr)
     
@@ -240,9 +475,10 @@ def radix_sort(arr):
     Radix Sort Algorithm
     
     Non-comparative integer sorting algorithm that sorts numbers digit by digit,
-    starting from least significant digit.
+    starting from least significant digit. Digits are bytes (base 256), so a
+    32-bit key takes 4 passes instead of 10. Keys must be non-negative.
     
-    Time Complexity: O(d * (n + k)), d = digits, k = base (usually 10)
+    Time Complexity: O(d * (n + k)), d = digits, k = base (256)
     Space Complexity: O(n + k)
     Stability: Stable
     
@@ -256,30 +492,22 @@ def radix_sort(arr):
         return []
     
     max_num = max(arr)
-    exp = 1  # digit position
+    shift = 0  # bit offset of the current byte-sized digit
     
-    def counting_sort_exp(arr, exp):
-        output = [0] * len(arr)
-        count = [0] * 10
-        
+    def counting_sort_byte(arr, shift):
+        # Stable distribution pass: one Python loop appends into per-byte buckets,
+        # and chain() concatenates them in C (replacing count/prefix-sum/scatter loops).
+        buckets = [[] for _ in range(256)]
         for num in arr:
-            index = (num // exp) % 10
-            count[index] += 1
-        
-        for i in range(1, 10):
-            count[i] += count[i-1]
-        
-        for i in reversed(range(len(arr))):
-            index = (arr[i] // exp) % 10
-            output[count[index] - 1] = arr[i]
-            count[index] -= 1
-        
-        return output
-    
-    output = arr
-    while max_num // exp > 0:
-        output = counting_sort_exp(output, exp)
-        exp *= 10
+            buckets[(num >> shift) & 0xFF].append(num)
+        if any(len(bucket) == len(arr) for bucket in buckets):
+            return arr  # every key has the same digit here: the pass would be a no-op
+        return list(chain.from_iterable(buckets))
+    
+    output = list(arr)  # the passes may hand their input back; never return the caller's list
+    while max_num >> shift:
+        output = counting_sort_byte(output, shift)
+        shift += 8
     
     return output
 
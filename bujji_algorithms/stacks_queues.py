@@ -1,3 +1,7 @@
+from array import array
+from collections import deque
+
+
 class Stack:
     """
     Stack (LIFO) data structure.
@@ -6,6 +10,7 @@ class Stack:
     - push(value)
     - pop()
     - peek()
+    - peek_n(k)            # top k items, top first
     - is_empty()
     - size()
     - clear()
@@ -42,6 +47,12 @@ class Stack:
             raise IndexError("peek from empty stack")
         return self._data[-1]
 
+    def peek_n(self, k):
+        # One reversed slice of just the top k, not a copy of the whole stack
+        if k <= 0:
+            return []
+        return self._data[:-k - 1:-1]
+
     def is_empty(self):
         return len(self._data) == 0
 
@@ -93,7 +104,7 @@ class Queue:
     1
     """
     def __init__(self):
-        self._data = []
+        self._data = deque()
 
     def enqueue(self, value):
         self._data.append(value)
@@ -101,7 +112,7 @@ class Queue:
     def dequeue(self):
         if self.is_empty():
             raise IndexError("dequeue from empty queue")
-        return self._data.pop(0)
+        return self._data.popleft()
 
     def peek(self):
         if self.is_empty():
@@ -118,7 +129,7 @@ class Queue:
         self._data.clear()
 
     def to_list(self):
-        return self._data[:]
+        return list(self._data)
 
     def display(self):
         print("Queue (front -> rear):")
@@ -136,6 +147,10 @@ class CircularQueue:
     """
     Circular Queue with fixed capacity.
 
+    Pass an ``array`` typecode (e.g. ``'d'`` for audio samples) to keep the
+    slots in a preallocated ``array.array`` of unboxed numbers instead of a
+    list of Python objects.
+
     Methods:
     - enqueue(value)
     - dequeue()
@@ -158,11 +173,12 @@ class CircularQueue:
     >>> list(cq)
     [20, 30]
     """
-    def __init__(self, capacity):
+    def __init__(self, capacity, typecode=None):
         if capacity <= 0:
             raise ValueError("Capacity must be positive")
         self._capacity = capacity
-        self._data = [None] * capacity
+        self.typecode = typecode
+        self._data = self._new_buffer()
         self._front = 0
         self._rear = 0
         self._size = 0
@@ -178,7 +194,8 @@ class CircularQueue:
         if self.is_empty():
             raise IndexError("dequeue from empty circular queue")
         value = self._data[self._front]
-        self._data[self._front] = None
+        if self.typecode is None:
+            self._data[self._front] = None
         self._front = (self._front + 1) % self._capacity
         self._size -= 1
         return value
@@ -198,18 +215,27 @@ class CircularQueue:
         return self._size
 
     def clear(self):
-        self._data = [None] * self._capacity
+        self._data = self._new_buffer()
         self._front = 0
         self._rear = 0
         self._size = 0
 
+    def _new_buffer(self):
+        if self.typecode is None:
+            return [None] * self._capacity
+        buf = array(self.typecode)
+        buf.frombytes(bytes(buf.itemsize * self._capacity))
+        return buf
+
     def to_list(self):
-        result = []
-        idx = self._front
-        for _ in range(self._size):
-            result.append(self._data[idx])
-            idx = (idx + 1) % self._capacity
-        return result
+        # At most two slice copies: the run up to the end of the buffer and
+        # the wrapped-around part.
+        end = self._front + self._size
+        if end <= self._capacity:
+            items = self._data[self._front:end]
+        else:
+            items = self._data[self._front:] + self._data[:self._rear]
+        return items if self.typecode is None else items.tolist()
 
     def display(self):
         print("CircularQueue (front -> rear):")
@@ -255,13 +281,13 @@ class Deque:
     0
     """
     def __init__(self):
-        self._data = []
+        self._data = deque()
 
     def append(self, value):
         self._data.append(value)
 
     def appendleft(self, value):
-        self._data.insert(0, value)
+        self._data.appendleft(value)
 
     def pop(self):
         if self.is_empty():
@@ -271,7 +297,7 @@ class Deque:
     def popleft(self):
         if self.is_empty():
             raise IndexError("popleft from empty deque")
-        return self._data.pop(0)
+        return self._data.popleft()
 
     def peek_right(self):
         if self.is_empty():
@@ -293,7 +319,7 @@ class Deque:
         self._data.clear()
 
     def to_list(self):
-        return self._data[:]
+        return list(self._data)
 
     def display(self):
         print("Deque (left -> right):")
@@ -332,13 +358,18 @@ class PriorityQueue:
     """
     def __init__(self):
         self._heap = []
+        # Sorted copy of _heap shared by to_list/display/__iter__; dropped
+        # on every mutation so repeated reads sort at most once.
+        self._sorted = None
 
     def push(self, priority, value):
         heapq.heappush(self._heap, (priority, value))
+        self._sorted = None
 
     def pop(self):
         if self.is_empty():
             raise IndexError("pop from empty priority queue")
+        self._sorted = None
         return heapq.heappop(self._heap)[1]
 
     def peek(self):
@@ -354,14 +385,20 @@ class PriorityQueue:
 
     def clear(self):
         self._heap.clear()
+        self._sorted = None
+
+    def _sorted_items(self):
+        if self._sorted is None:
+            self._sorted = sorted(self._heap)
+        return self._sorted
 
     def to_list(self):
         # Return values sorted by priority (lowest first)
-        return [v for p, v in sorted(self._heap)]
+        return [v for p, v in self._sorted_items()]
 
     def display(self):
         print("PriorityQueue (lowest priority first):")
-        for p, v in sorted(self._heap):
+        for p, v in self._sorted_items():
             print(f"Priority: {p}, Value: {v}")
 
     def __len__(self):
@@ -369,7 +406,7 @@ class PriorityQueue:
 
     def __iter__(self):
         # Iterate values sorted by priority
-        for _, v in sorted(self._heap):
+        for _, v in self._sorted_items():
             yield v
 
 
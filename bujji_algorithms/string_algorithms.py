@@ -14,6 +14,11 @@ This module contains implementations of common string algorithms:
 Each function has clear docstrings explaining usage, inputs, outputs, and complexity.
 """
 
+from collections import Counter
+
+# Below this length sorting the characters is cheaper than building Counters.
+_ANAGRAM_SORT_CUTOFF = 200
+
 
 def is_palindrome(s: str, ignore_case: bool = False, ignore_spaces: bool = False) -> bool:
     """
@@ -35,7 +40,12 @@ def is_palindrome(s: str, ignore_case: bool = False, ignore_spaces: bool = False
         s = s.lower()
     if ignore_spaces:
         s = s.replace(" ", "")
-    return s == s[::-1]
+    half = len(s) // 2
+    if half and s[0] != s[-1]:
+        return False
+    # First half against the reversed second half: two half-length copies
+    # compared in C, instead of reversing and comparing the whole string.
+    return s[:half] == s[:-half - 1:-1]
 
 
 def are_anagrams(s1: str, s2: str, ignore_case: bool = False, ignore_spaces: bool = False) -> bool:
@@ -61,10 +71,28 @@ def are_anagrams(s1: str, s2: str, ignore_case: bool = False, ignore_spaces: boo
     if ignore_spaces:
         s1 = s1.replace(" ", "")
         s2 = s2.replace(" ", "")
-    return sorted(s1) == sorted(s2)
+    if len(s1) != len(s2):
+        return False
+    if len(s1) < _ANAGRAM_SORT_CUTOFF:
+        return sorted(s1) == sorted(s2)
+    # O(m) character histograms instead of an O(m log m) sort
+    return Counter(s1) == Counter(s2)
 
 
-def rabin_karp(text: str, pattern: str, prime: int = 101) -> list[int]:
+def _find_all(text: str, pattern: str) -> list[int]:
+    """All (possibly overlapping) start indices of pattern, via C-level str.find."""
+    occurrences = []
+    if not pattern:
+        return occurrences
+    find = text.find
+    i = find(pattern)
+    while i != -1:
+        occurrences.append(i)
+        i = find(pattern, i + 1)
+    return occurrences
+
+
+def rabin_karp(text: str, pattern: str, prime: int = 101, use_rolling_hash: bool = False) -> list[int]:
     """
     Rabin-Karp pattern matching algorithm.
 
@@ -72,6 +100,9 @@ def rabin_karp(text: str, pattern: str, prime: int = 101) -> list[int]:
         text (str): Text string to search in.
         pattern (str): Pattern string to search for.
         prime (int): Prime number for hash modulo to reduce collisions.
+        use_rolling_hash (bool): If True, run the Rabin-Karp rolling hash loop.
+            By default the search is delegated to ``str.find`` (C code), which
+            returns the same indices far faster.
 
     Returns:
         list[int]: List of starting indices where pattern is found.
@@ -83,21 +114,27 @@ def rabin_karp(text: str, pattern: str, prime: int = 101) -> list[int]:
     Complexity:
         Average: O(n + m), Worst: O(n*m) due to collisions.
     """
+    if not pattern:
+        return []  # for both paths, as in rabin_karp_search
+    if not use_rolling_hash:
+        return _find_all(text, pattern)
     n, m = len(text), len(pattern)
     if m > n:
         return []
     base = 256  # number of possible characters (extended ASCII)
-    pattern_hash = 0
-    text_hash = 0
-    h = 1  # base^(m-1) % prime
-
-    for i in range(m-1):
-        h = (h * base) % prime
-
-    # Initial hash values
-    for i in range(m):
-        pattern_hash = (base * pattern_hash + ord(pattern[i])) % prime
-        text_hash = (base * text_hash + ord(text[i])) % prime
+    h = pow(base, max(m - 1, 0), prime)  # base^(m-1) % prime
+
+    # Initial hash values. With base 256 the hash of a Latin-1 string is its
+    # bytes read as one big-endian integer, which int.from_bytes builds in C.
+    try:
+        pattern_hash = int.from_bytes(pattern.encode("latin-1"), "big") % prime
+        text_hash = int.from_bytes(text[:m].encode("latin-1"), "big") % prime
+    except UnicodeEncodeError:
+        pattern_hash = 0
+        text_hash = 0
+        for i in range(m):
+            pattern_hash = (base * pattern_hash + ord(pattern[i])) % prime
+            text_hash = (base * text_hash + ord(text[i])) % prime
 
     occurrences = []
 
@@ -114,6 +151,27 @@ def rabin_karp(text: str, pattern: str, prime: int = 101) -> list[int]:
     return occurrences
 
 
+def _horspool_search(text: str, pattern: str) -> list[int]:
+    """
+    Boyer-Moore-Horspool search: compare a window with str.startswith, then
+    slide it by the bad-character shift of the window's last character.
+    """
+    m = len(pattern)
+    last = m - 1
+    # Distance from each character's last position (excluding the final
+    # one) to the end of the pattern; absent characters shift by m.
+    shift = {char: last - i for i, char in enumerate(pattern[:last])}.get
+    matches = text.startswith
+    occurrences = []
+    i = 0
+    end = len(text) - m
+    while i <= end:
+        if matches(pattern, i):
+            occurrences.append(i)
+        i += shift(text[i + last], m)
+    return occurrences
+
+
 def kmp_search(text: str, pattern: str) -> list[int]:
     """
     Knuth-Morris-Pratt (KMP) pattern matching algorithm.
@@ -125,47 +183,49 @@ def kmp_search(text: str, pattern: str) -> list[int]:
     Returns:
         list[int]: List of starting indices where pattern is found.
 
+    Patterns of 4 to 64 characters are searched with Boyer-Moore-Horspool
+    instead, whose bad-character shift can skip up to m characters per
+    window; shorter patterns skip too little to pay for it, and KMP keeps
+    its linear worst case for longer ones.
+
     Example:
         >>> kmp_search("ababcabcabababd", "ababd")
         [10]
 
     Complexity:
         O(n + m), where n = len(text), m = len(pattern)
+        (Horspool path: O(n / m) best, O(n * m) worst, m <= 64)
     """
     def compute_lps(pattern: str) -> list[int]:
         lps = [0] * len(pattern)
         length = 0  # length of the previous longest prefix suffix
-        i = 1
-        while i < len(pattern):
-            if pattern[i] == pattern[length]:
+        for i in range(1, len(pattern)):
+            char = pattern[i]
+            while length and pattern[length] != char:
+                length = lps[length-1]
+            if pattern[length] == char:
                 length += 1
-                lps[i] = length
-                i += 1
-            else:
-                if length != 0:
-                    length = lps[length-1]
-                else:
-                    lps[i] = 0
-                    i += 1
+            lps[i] = length
         return lps
 
+    m = len(pattern)
+    if m == 0 or m > len(text):
+        return []
+    if 4 <= m <= 64:
+        return _horspool_search(text, pattern)
     lps = compute_lps(pattern)
-    i = 0  # index for text
     j = 0  # index for pattern
     occurrences = []
 
-    while i < len(text):
-        if pattern[j] == text[i]:
-            i += 1
-            j += 1
-        if j == len(pattern):
-            occurrences.append(i - j)
+    # One pass over the text; j only falls back through lps on a mismatch.
+    for i, char in enumerate(text):
+        while j and pattern[j] != char:
             j = lps[j-1]
-        elif i < len(text) and pattern[j] != text[i]:
-            if j != 0:
+        if pattern[j] == char:
+            j += 1
+            if j == m:
+                occurrences.append(i - m + 1)
                 j = lps[j-1]
-            else:
-                i += 1
     return occurrences
 
 
@@ -187,29 +247,34 @@ def z_algorithm_search(text: str, pattern: str) -> list[int]:
     Complexity:
         O(n + m), where n = len(text), m = len(pattern)
     """
+    m = len(pattern)
+    if m == 0:
+        return []
     concat = pattern + "$" + text
-    Z = [0] * len(concat)
+    n = len(concat)
+    Z = [0] * n
     left, right = 0, 0
 
-    for i in range(1, len(concat)):
-        if i <= right:
-            Z[i] = min(right - i + 1, Z[i - left])
-        while i + Z[i] < len(concat) and concat[Z[i]] == concat[i + Z[i]]:
-            Z[i] += 1
-        if i + Z[i] - 1 > right:
-            left, right = i, i + Z[i] - 1
+    for i in range(1, n):
+        # Start from what the current Z-box already guarantees, then extend
+        z = min(right - i + 1, Z[i - left]) if i <= right else 0
+        while i + z < n and concat[z] == concat[i + z]:
+            z += 1
+        Z[i] = z
+        if i + z - 1 > right:
+            left, right = i, i + z - 1
 
-    occurrences = []
-    m = len(pattern)
-    for i in range(m+1, len(concat)):
-        if Z[i] == m:
-            occurrences.append(i - m - 1)
-    return occurrences
+    # >= rather than ==: a "$" in the text can extend a match past the separator
+    return [i - m - 1 for i in range(m + 1, n) if Z[i] >= m]
 
 
 def longest_palindromic_substring(s: str) -> str:
     """
-    Finds the longest palindromic substring in s using expand-around-center.
+    Finds the longest palindromic substring in s.
+
+    Runs Manacher's algorithm (``manacher_longest_palindrome``) rather than
+    expanding around all 2n - 1 centers: both return the leftmost of the
+    longest palindromes, but Manacher reuses mirrored radii and is linear.
 
     Args:
         s (str): Input string.
@@ -222,34 +287,17 @@ def longest_palindromic_substring(s: str) -> str:
         'bab'  # or 'aba'
 
     Complexity:
-        O(n^2) time, O(1) space.
+        O(n) time, O(n) space.
     """
-    if not s:
-        return ""
-
-    def expand_around_center(left: int, right: int) -> str:
-        while left >= 0 and right < len(s) and s[left] == s[right]:
-            left -= 1
-            right += 1
-        return s[left+1:right]
-
-    longest = ""
-    for i in range(len(s)):
-        # odd length palindrome
-        odd_pal = expand_around_center(i, i)
-        if len(odd_pal) > len(longest):
-            longest = odd_pal
-        # even length palindrome
-        even_pal = expand_around_center(i, i+1)
-        if len(even_pal) > len(longest):
-            longest = even_pal
-    return longest
+    return manacher_longest_palindrome(s)
 
 
 def manacher_algorithm(s: str) -> str:
     """
     Manacher's algorithm to find longest palindromic substring in O(n) time.
 
+    Kept for backward compatibility; delegates to ``manacher_longest_palindrome``.
+
     Args:
         s (str): Input string.
 
@@ -263,31 +311,7 @@ def manacher_algorithm(s: str) -> str:
     Complexity:
         O(n) time, O(n) space.
     """
-    if not s:
-        return ""
-
-    # Transform string: insert '#' between chars and add sentinels to handle even-length palindromes
-    T = '#'.join('^{}$'.format(s))
-    n = len(T)
-    P = [0] * n
-    center = 0
-    right = 0
-
-    for i in range(1, n - 1):
-        mirror = 2*center - i
-        if i < right:
-            P[i] = min(right - i, P[mirror])
-        # Expand palindrome centered at i
-        while T[i + 1 + P[i]] == T[i - 1 - P[i]]:
-            P[i] += 1
-        # Update center and right boundary
-        if i + P[i] > right:
-            center, right = i, i + P[i]
-
-    # Find max palindrome length and center index
-    max_len, center_index = max((v, i) for i, v in enumerate(P))
-    start = (center_index - max_len) // 2  # start index in original string
-    return s[start:start + max_len]
+    return manacher_longest_palindrome(s)
 
 
 def string_compression(s: str) -> str:
@@ -325,13 +349,15 @@ def string_compression(s: str) -> str:
     result = "".join(compressed)
     return result if len(result) < len(s) else s
 
-def rabin_karp_search(text: str, pattern: str) -> list[int]:
+def rabin_karp_search(text: str, pattern: str, use_rolling_hash: bool = False) -> list[int]:
     """
     Rabin-Karp algorithm for pattern searching using rolling hash.
 
     Args:
         text (str): The text in which to search.
         pattern (str): The pattern to search for.
+        use_rolling_hash (bool): If True, run the rolling hash loop instead of
+            the default ``str.find`` scan.
 
     Returns:
         list[int]: Starting indices where pattern is found in text.
@@ -342,31 +368,66 @@ def rabin_karp_search(text: str, pattern: str) -> list[int]:
     """
     if pattern == "" or text == "":
         return []
-
-    d = 256  # Number of characters in input alphabet
-    q = 101  # A prime number for modulus
+    if not use_rolling_hash:
+        return _find_all(text, pattern)
+
+    d = 257  # Base, larger than any byte value
+    # Mersenne prime 2**61 - 1: window hashes of different strings collide
+    # with probability ~2**-61, so the slice check below almost never runs
+    # for nothing (with q = 101 about one window in a hundred did).
+    q = (1 << 61) - 1
     m = len(pattern)
     n = len(text)
-    h = pow(d, m-1) % q
-    p = 0  # hash value for pattern
-    t = 0  # hash value for text
+    if m > n:
+        return []
+    h = pow(d, m-1, q)
     result = []
 
-    # Initial hash calculation
-    for i in range(m):
-        p = (d * p + ord(pattern[i])) % q
-        t = (d * t + ord(text[i])) % q
+    def window_hash(start):
+        x = 0
+        for code in map(ord, text[start:start + m]):
+            x = (d * x + code) % q
+        return x
 
-    # Slide over text
-    for s in range(n - m + 1):
-        if p == t:
-            # Check actual characters to avoid collision
-            if text[s:s+m] == pattern:
+    p = 0  # hash value for pattern
+    for code in map(ord, pattern):
+        p = (d * p + code) % q
+
+    first = pattern[0]
+    last_start = n - m + 1
+    # Python's % is never negative, so no correction step is needed below.
+    if text.count(first, 0, last_start) > last_start >> 3:
+        # pattern[0] is common: slide over every window, dropping the
+        # outgoing character, shifting, and adding the incoming one.
+        t = window_hash(0)
+        s = 0
+        for out_code, in_code in zip(map(ord, text[:n - m]), map(ord, text[m:])):
+            if p == t and text.startswith(pattern, s):
                 result.append(s)
-        if s < n - m:
-            t = (t - h * ord(text[s])) % q
-            t = (t * d + ord(text[s + m])) % q
-            t = (t + q) % q  # Make sure t is positive
+            t = ((t - h * out_code) * d + in_code) % q
+            s += 1
+        if p == t and text.startswith(pattern, s):
+            result.append(s)
+        return result
+
+    # pattern[0] is rare: only windows starting with it can match, and
+    # str.find jumps to the next one in C. A nearby candidate is reached by
+    # rolling the hash forward; one at least m away gets a fresh hash, which
+    # costs no more.
+    find = text.find
+    s = find(first, 0, last_start)
+    pos = -1  # start of the window t currently hashes
+    t = 0  # hash value for text
+    while s != -1:
+        if pos < 0 or s - pos >= m:
+            t = window_hash(s)
+        else:
+            for k in range(pos, s):
+                t = ((t - h * ord(text[k])) * d + ord(text[k + m])) % q
+        pos = s
+        if p == t and text.startswith(pattern, s):
+            result.append(s)
+        s = find(first, s + 1, last_start)
     return result
 
 def manacher_longest_palindrome(s: str) -> str:
@@ -396,27 +457,24 @@ def manacher_longest_palindrome(s: str) -> str:
     max_center = 0
 
     for i in range(n):
-        mirror = 2 * center - i
-
-        if i < right:
-            p[i] = min(right - i, p[mirror])
-
-        # Expand palindrome centered at i
-        a = i + p[i] + 1
-        b = i - p[i] - 1
+        # Radius known from the mirror position, then expand past it
+        radius = min(right - i, p[2 * center - i]) if i < right else 0
+        a = i + radius + 1
+        b = i - radius - 1
         while a < n and b >= 0 and t[a] == t[b]:
-            p[i] += 1
             a += 1
             b -= 1
+        radius = a - i - 1
+        p[i] = radius
 
         # Update center and right boundary
-        if i + p[i] > right:
+        if i + radius > right:
             center = i
-            right = i + p[i]
+            right = i + radius
 
         # Track max palindrome length
-        if p[i] > max_len:
-            max_len = p[i]
+        if radius > max_len:
+            max_len = radius
             max_center = i
 
     # Extract longest palindrome from original string
@@ -5,7 +5,10 @@ This module implements various tree-based data structures,
 each with specific real-world applications and performance guarantees.
 """
 
+from array import array
 from collections import deque
+from itertools import accumulate
+from operator import add
 
 
 class BinaryTree:
@@ -25,25 +28,50 @@ class BinaryTree:
         root.right = BinaryTree(3)
         root.inorder()  # [2, 1, 3]
     """
+    __slots__ = ['value', 'left', 'right']
+
     def __init__(self, value):
         self.value = value
         self.left = None
         self.right = None
 
+    # Traversals walk an explicit stack rather than recursing and
+    # concatenating child lists, so deep or skewed trees cost O(n) and never
+    # hit the recursion limit.
     def inorder(self):
-        return (self.left.inorder() if self.left else []) + \
-               [self.value] + \
-               (self.right.inorder() if self.right else [])
+        res = []
+        stack = []
+        node = self
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            res.append(node.value)
+            node = node.right
+        return res
 
     def preorder(self):
-        return [self.value] + \
-               (self.left.preorder() if self.left else []) + \
-               (self.right.preorder() if self.right else [])
+        res = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            res.append(node.value)
+            if node.right: stack.append(node.right)
+            if node.left: stack.append(node.left)
+        return res
 
     def postorder(self):
-        return (self.left.postorder() if self.left else []) + \
-               (self.right.postorder() if self.right else []) + \
-               [self.value]
+        # Root-right-left order, reversed, is left-right-root
+        res = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            res.append(node.value)
+            if node.left: stack.append(node.left)
+            if node.right: stack.append(node.right)
+        res.reverse()
+        return res
 
     def level_order(self):
         q = deque([self])
@@ -61,6 +89,107 @@ class BinaryTree:
     def to_list(self):
         return self.level_order()
 
+    def freeze(self):
+        """
+        Return a read-only FrozenTree snapshot for traversal-heavy workloads.
+
+        Nodes are numbered in level order (the root is 0) and the child links
+        are stored as ids in two ``array('q')`` columns.
+        """
+        values = []
+        left = array('q')
+        right = array('q')
+        nodes = [self]
+        # nodes grows while it is scanned, so ids are assigned in BFS order
+        for node in nodes:
+            values.append(node.value)
+            if node.left:
+                left.append(len(nodes))
+                nodes.append(node.left)
+            else:
+                left.append(-1)
+            if node.right:
+                right.append(len(nodes))
+                nodes.append(node.right)
+            else:
+                right.append(-1)
+        return FrozenTree(values, left, right)
+
+
+class FrozenTree:
+    """
+    Frozen Binary Tree
+    ==================
+    Read-only binary tree in struct-of-arrays form, produced by
+    ``BinaryTree.freeze()``.
+
+    Node ``i`` holds ``values[i]``; its children are the ids ``left[i]`` and
+    ``right[i]`` (``-1`` when absent). The links live in two contiguous
+    ``array('q')`` columns (8 bytes each per node) instead of one Python
+    object per node, so traversals are integer index lookups.
+
+    Usage:
+        root = BinaryTree(1)
+        root.left = BinaryTree(2)
+        root.right = BinaryTree(3)
+        frozen = root.freeze()
+        frozen.inorder()  # [2, 1, 3]
+    """
+    def __init__(self, values, left, right):
+        self.values = values
+        self.left = left
+        self.right = right
+
+    def __len__(self):
+        return len(self.values)
+
+    def inorder(self):
+        values, left, right = self.values, self.left, self.right
+        res = []
+        stack = []
+        i = 0 if values else -1
+        while stack or i >= 0:
+            while i >= 0:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            res.append(values[i])
+            i = right[i]
+        return res
+
+    def preorder(self):
+        values, left, right = self.values, self.left, self.right
+        res = []
+        stack = [0] if values else []
+        while stack:
+            i = stack.pop()
+            res.append(values[i])
+            if right[i] >= 0: stack.append(right[i])
+            if left[i] >= 0: stack.append(left[i])
+        return res
+
+    def postorder(self):
+        values, left, right = self.values, self.left, self.right
+        res = []
+        stack = [0] if values else []
+        while stack:
+            i = stack.pop()
+            res.append(values[i])
+            if left[i] >= 0: stack.append(left[i])
+            if right[i] >= 0: stack.append(right[i])
+        res.reverse()
+        return res
+
+    def level_order(self):
+        # Ids were assigned in level order
+        return list(self.values)
+
+    def display(self):
+        print("Level-order:", self.level_order())
+
+    def to_list(self):
+        return self.level_order()
+
 
 class BinarySearchTree(BinaryTree):
     """
@@ -75,6 +204,8 @@ class BinarySearchTree(BinaryTree):
         bst.insert(15)
         bst.search(5)  # True
     """
+    __slots__ = []
+
     def insert(self, value):
         if value < self.value:
             if self.left: self.left.insert(value)
@@ -105,16 +236,29 @@ class AVLTree(BinarySearchTree):
         avl.insert(5)
         avl.insert(4)  # Will rebalance automatically
     """
+    __slots__ = ['_h']
+
+    def __init__(self, value):
+        super().__init__(value)
+        self._h = 1  # cached subtree height, maintained by insert
+
     def height(self, node):
-        if not node:
-            return 0
-        return 1 + max(self.height(node.left), self.height(node.right))
+        return node._h if node else 0
 
     def balance_factor(self):
         return self.height(self.left) - self.height(self.right)
 
     def insert(self, value):
-        super().insert(value)
+        if value < self.value:
+            if self.left: self.left.insert(value)
+            else: self.left = AVLTree(value)
+        elif value > self.value:
+            if self.right: self.right.insert(value)
+            else: self.right = AVLTree(value)
+        else:
+            return
+        # Children are already up to date, so this is O(1) per level
+        self._h = 1 + max(self.height(self.left), self.height(self.right))
         # Balancing logic placeholder (rotations needed in real implementation)
 
 
@@ -133,6 +277,8 @@ class RedBlackTree:
         rbt.insert(20)
     """
     class Node:
+        __slots__ = ['value', 'color', 'left', 'right', 'parent']
+
         def __init__(self, value, color="red"):
             self.value = value
             self.color = color
@@ -151,14 +297,21 @@ class RedBlackTree:
             pass
 
     def to_list(self):
+        # Iterative inorder walk with pre-bound list methods: no Python
+        # frame per node, and no recursion limit on deep trees
         res = []
-        def inorder(node):
-            if not node: return
-            inorder(node.left)
-            res.append(node.value)
-            inorder(node.right)
-        inorder(self.root)
-        return res
+        stack = []
+        push, pop, append = stack.append, stack.pop, res.append
+        node = self.root
+        while True:
+            while node is not None:
+                push(node)
+                node = node.left
+            if not stack:
+                return res
+            node = pop()
+            append(node.value)
+            node = node.right
 
 
 class SegmentTree:
@@ -167,6 +320,15 @@ class SegmentTree:
     ============
     Array-based tree for efficient range queries & updates.
 
+    Alongside the tree it keeps a prefix-sum list so that, while there are
+    no updates, ``range_sum`` is a single subtraction. ``update`` drops the
+    prefix sums; queries then walk the tree, and the prefix sums are rebuilt
+    once enough queries (``n // 32``) have run since the last update to pay
+    for the O(n) rebuild. The prefix path is only used while every leaf is
+    an ``int``: float sums are not associative, so a prefix difference can
+    differ from (or cancel to zero against) the tree's answer. With any
+    non-int leaf, every query walks the tree.
+
     Usage:
         st = SegmentTree([1, 3, 5, 7, 9, 11])
         st.range_sum(1, 3)  # sum of [3,5,7]
@@ -177,32 +339,62 @@ class SegmentTree:
         self.build(data)
 
     def build(self, data):
-        for i in range(self.n):
-            self.tree[self.n + i] = data[i]
-        for i in range(self.n - 1, 0, -1):
-            self.tree[i] = self.tree[2 * i] + self.tree[2 * i + 1]
+        tree = self.tree
+        tree[self.n:] = data
+        # Leaves that are not exact ints; the prefix path needs this at zero
+        self._non_int = sum(type(v) is not int for v in data)
+        # Fill internal nodes a block at a time: the children of every i in
+        # [lo, hi) lie in [2*lo, 2*hi), which is at or past hi and so done.
+        hi = self.n
+        while hi > 1:
+            lo = (hi + 1) // 2
+            tree[lo:hi] = map(add, tree[2 * lo:2 * hi:2], tree[2 * lo + 1:2 * hi:2])
+            hi = lo
+        self._rebuild_prefix()
+
+    def _rebuild_prefix(self):
+        self._stale_queries = 0
+        if self._non_int:
+            self._prefix = None
+            return
+        # prefix[i] is the sum of the first i leaves
+        self._prefix = list(accumulate(self.tree[self.n:], initial=0))
 
     def range_sum(self, l, r):
+        if l > r:
+            return 0
+        if self._prefix is None and not self._non_int:
+            self._stale_queries += 1
+            if self._stale_queries > self.n >> 5:
+                self._rebuild_prefix()
+        if self._prefix is not None:
+            return self._prefix[r + 1] - self._prefix[l]
+        tree = self.tree
         l += self.n
-        r += self.n
+        r += self.n + 1  # half-open [l, r)
         s = 0
-        while l <= r:
-            if l % 2 == 1:
-                s += self.tree[l]
+        while l < r:
+            if l & 1:
+                s += tree[l]
                 l += 1
-            if r % 2 == 0:
-                s += self.tree[r]
+            if r & 1:
                 r -= 1
-            l //= 2
-            r //= 2
+                s += tree[r]
+            l >>= 1
+            r >>= 1
         return s
 
     def update(self, index, value):
+        tree = self.tree
         pos = index + self.n
-        self.tree[pos] = value
+        self._non_int += (type(value) is not int) - (type(tree[pos]) is not int)
+        tree[pos] = value
+        self._prefix = None
+        self._stale_queries = 0
+        # pos ^ 1 is the sibling; their sum is the parent, pos >> 1
         while pos > 1:
-            pos //= 2
-            self.tree[pos] = self.tree[2 * pos] + self.tree[2 * pos + 1]
+            tree[pos >> 1] = tree[pos] + tree[pos ^ 1]
+            pos >>= 1
 
 
 class FenwickTree:
@@ -215,21 +407,41 @@ class FenwickTree:
         ft = FenwickTree(10)
         ft.update(3, 5)
         ft.prefix_sum(3)  # 5
+
+        ft = FenwickTree.from_array([3, 2, -1, 6])  # data[0] is index 1
+        ft.prefix_sum(3)  # 4
     """
     def __init__(self, size):
         self.size = size
         self.tree = [0] * (size + 1)
 
+    @classmethod
+    def from_array(cls, data):
+        """Build a tree over data (1-indexed) in O(n) rather than n updates."""
+        ft = cls(len(data))
+        tree = ft.tree
+        tree[1:] = data
+        size = ft.size
+        # Push each node's total into its parent once
+        for i in range(1, size + 1):
+            j = i + (i & -i)
+            if j <= size:
+                tree[j] += tree[i]
+        return ft
+
     def update(self, index, delta):
-        while index <= self.size:
-            self.tree[index] += delta
+        tree = self.tree
+        size = self.size
+        while index <= size:
+            tree[index] += delta
             index += index & -index
 
     def prefix_sum(self, index):
+        tree = self.tree
         s = 0
         while index > 0:
-            s += self.tree[index]
-            index -= index & -index
+            s += tree[index]
+            index &= index - 1  # clear the lowest set bit
         return s
 
 
@@ -245,6 +457,10 @@ class Trie:
         trie.search("apple")    # True
         trie.starts_with("app") # True
     """
+    # Key that marks the end of a word. Not a str, so it can never collide
+    # with a character of an inserted word (a "$" key could).
+    _END = None
+
     def __init__(self):
         self.root = {}
 
@@ -254,7 +470,7 @@ class Trie:
             if ch not in node:
                 node[ch] = {}
             node = node[ch]
-        node["$"] = True
+        node[self._END] = True
 
     def search(self, word):
         node = self.root
@@ -262,7 +478,7 @@ class Trie:
             if ch not in node:
                 return False
             node = node[ch]
-        return "$" in node
+        return self._END in node
 
     def starts_with(self, prefix):
         node = self.root
@@ -319,6 +535,13 @@ def real_world_examples():
            Autocomplete systems, spell checkers.
        Benefit:
            Extremely fast prefix lookups.
+
+    8. FrozenTree
+       Scenario:
+           A parsed expression or decision tree that is built once and then
+           traversed many times.
+       Benefit:
+           Child links in flat integer arrays: compact, no per-node objects.
     """
     print(real_world_examples.__doc__)
 
@@ -329,7 +552,7 @@ def list_classes():
 
 
 __all__ = [
-    "BinaryTree", "BinarySearchTree", "AVLTree", "RedBlackTree",
+    "BinaryTree", "FrozenTree", "BinarySearchTree", "AVLTree", "RedBlackTree",
     "SegmentTree", "FenwickTree", "Trie",
     "real_world_examples", "list_classes"
 ]
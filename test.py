@@ -1,4 +1,8 @@
 from bujji_algorithms.heaps import *
+from bujji_algorithms.arrays import SparseMatrix
+from bujji_algorithms.graphs import AdjacencyListGraph, WeightedGraph
+from bujji_algorithms.linked_lists import SinglyLinkedList
+from bujji_algorithms.trees import BinaryTree, SegmentTree
 
 
 def test_min_heap():
@@ -26,6 +30,30 @@ def test_min_heap():
     print("  Built heap from list:", h.to_list())
     assert h.extract_min() == 2, "❌ MinHeap build_heap failed"
 
+    check_batch_ops(MinHeap(), is_min=True)
+
+
+def test_min_heap_typecode():
+    print("\nTesting MinHeap('q')...")
+    h = MinHeap('q')
+
+    for num in [5, 3, 8, 1, 4]:
+        h.insert(num)
+    extracted = [h.extract_min() for _ in range(len(h.to_list()))]
+    assert extracted == [1, 3, 4, 5, 8], "❌ MinHeap('q') did not extract in sorted order"
+    print("  ✅ Extraction order:", extracted)
+
+    try:
+        h.insert(1.5)
+    except TypeError as e:
+        print("  ✅ Non-integer insert raised:", e)
+    else:
+        raise AssertionError("❌ MinHeap('q') accepted a float")
+
+    h.build_heap([7, 2, 9, 4])
+    assert h.extract_min() == 2, "❌ MinHeap('q') build_heap failed"
+    check_batch_ops(MinHeap('q'), is_min=True)
+
 
 def test_max_heap():
     print("\nTesting MaxHeap...")
@@ -48,6 +76,8 @@ def test_max_heap():
     print("  Built heap from list:", h.to_list())
     assert h.extract_max() == 9, "❌ MaxHeap build_heap failed"
 
+    check_batch_ops(MaxHeap(), is_min=False)
+
 
 def test_dary_heap():
     print("\nTesting DAryHeap (3-ary)...")
@@ -70,12 +100,284 @@ def test_dary_heap():
     print("  Built heap from list:", h.to_list())
     assert h.extract_min() == 3, "❌ DAryHeap build_heap failed"
 
+    check_batch_ops(DAryHeap(d=3), is_min=True)
+
+
+def check_batch_ops(h, is_min):
+    """Exercise insert_many, pushpop and replace on an empty heap `h`."""
+    name = type(h).__name__
+    extract = h.extract_min if is_min else h.extract_max
+
+    try:
+        h.replace(1)
+    except IndexError as e:
+        print("  ✅ Empty replace raised:", e)
+    else:
+        raise AssertionError(f"❌ {name}.replace on an empty heap did not raise")
+
+    # pushpop on an empty heap hands the value straight back
+    assert h.pushpop(6) == 6 and h.is_empty(), f"❌ {name}.pushpop on an empty heap failed"
+
+    # A batch larger than the heap (rebuild), then a smaller one (sift each item)
+    h.insert_many([9, 2, 7, 4, 1, 8])
+    h.insert_many([5, 3])
+    values = [9, 2, 7, 4, 1, 8, 5, 3]
+    print(f"  insert_many -> heap={h.to_list()}")
+
+    # pushpop: a value that beats the root comes straight back out
+    best = min(values) if is_min else max(values)
+    beaten = best - 1 if is_min else best + 1
+    assert h.pushpop(beaten) == beaten, f"❌ {name}.pushpop did not return the better value"
+    assert h.pushpop(6) == best, f"❌ {name}.pushpop did not return the root"
+    values.remove(best)
+    values.append(6)
+
+    # replace always returns the old root, even if the new value is better
+    old_root = min(values) if is_min else max(values)
+    assert h.replace(beaten) == old_root, f"❌ {name}.replace did not return the old root"
+    values.remove(old_root)
+    values.append(beaten)
+
+    extracted = [extract() for _ in range(len(h.to_list()))]
+    assert extracted == sorted(values, reverse=not is_min), f"❌ {name} order broken after batch ops"
+    print("  ✅ insert_many/pushpop/replace order:", extracted)
+
+
+def test_sparse_matrix():
+    print("\nTesting SparseMatrix...")
+    sm = SparseMatrix(4, 5)
+    dense = [[0] * 5 for _ in range(4)]
+
+    for r, c, v in [(0, 3, 7), (0, 1, 2), (2, 4, 9), (3, 0, 1), (0, 3, 8)]:
+        sm.set(r, c, v)
+        dense[r][c] = v
+    assert sm.to_dense() == dense, "❌ SparseMatrix.to_dense mismatch"
+    assert sm.nnz == 4, "❌ SparseMatrix.nnz wrong after overwrite"
+    assert list(sm.row_nonzeros(0)[0]) == [1, 3], "❌ SparseMatrix row columns not sorted"
+
+    indptr, indices, values = sm.to_csr()
+    assert list(indptr) == [0, 2, 2, 3, 4], "❌ SparseMatrix CSR indptr wrong"
+    assert list(indices) == [1, 3, 4, 0] and list(values) == [2, 8, 9, 1], "❌ SparseMatrix CSR data wrong"
+    assert sm.to_csr() is sm.to_csr(), "❌ SparseMatrix CSR not cached between writes"
+    print("  ✅ CSR:", list(indptr), list(indices), list(values))
+
+    # Every write must drop the cached CSR arrays
+    cached = sm.to_csr()
+    sm.set(1, 2, 5)
+    dense[1][2] = 5
+    assert sm.to_csr() is not cached, "❌ SparseMatrix CSR cache survived an insert"
+    assert list(sm.to_csr()[0]) == [0, 2, 3, 4, 5], "❌ SparseMatrix CSR stale after insert"
+    cached = sm.to_csr()
+    sm.set(0, 1, 0)  # back to default: entry removed
+    dense[0][1] = 0
+    assert sm.to_csr() is not cached, "❌ SparseMatrix CSR cache survived a removal"
+    assert sm.nnz == 4 and sm.get(0, 1) == 0, "❌ SparseMatrix removal failed"
+    assert sm.to_dense() == dense and sm[1] == dense[1], "❌ SparseMatrix dense view stale"
+    sm.set(1, 1, 0)  # removing an absent entry is a no-op
+    assert sm.nnz == 4, "❌ SparseMatrix removal of an absent entry changed nnz"
+    print("  ✅ Cache invalidated on insert and removal")
+
+    typed = SparseMatrix(2, 2, typecode='d')
+    typed.set(0, 0, 1.5)
+    try:
+        typed.set(1, 1, "x")
+    except TypeError as e:
+        print("  ✅ Bad typed value raised:", e)
+    else:
+        raise AssertionError("❌ SparseMatrix(typecode='d') accepted a str")
+    assert typed.nnz == 1 and typed.to_dense() == [[1.5, 0], [0, 0]], "❌ SparseMatrix changed after a bad set"
+
+
+def test_csr_graph():
+    print("\nTesting CSRGraph / PackedCSRGraph...")
+    g = AdjacencyListGraph()
+    edges = [("A", "D"), ("A", "B"), ("B", "C"), ("C", "A"), ("D", "C"), ("E", "A")]
+    for u, v in edges:
+        g.add_edge(u, v)
+
+    for order in (None, "bfs"):
+        csr = g.freeze(order=order)
+        packed = csr.pack()
+        assert csr.num_vertices() == packed.num_vertices() == 5, "❌ CSR vertex count wrong"
+        assert csr.num_edges() == packed.num_edges() == len(edges), "❌ CSR edge count wrong"
+        for v in g.graph:
+            i = csr.index[v]
+            assert sorted(csr.get_neighbors(v)) == sorted(g.get_neighbors(v)), f"❌ CSR neighbors of {v} wrong"
+            assert packed.neighbors(i) == sorted(csr.neighbors(i).tolist()), f"❌ Packed neighbors of {v} wrong"
+            assert packed.degree(i) == csr.degree(i) == len(g.get_neighbors(v)), f"❌ degree of {v} wrong"
+        print(f"  ✅ order={order!r} round-trip:", {v: csr.get_neighbors(v) for v in csr.vertices})
+
+    # Hop distances from A: B, D at 1; C at 2; E is unreachable
+    csr = g.freeze()
+    dist = csr.bfs(csr.index["A"])
+    assert {v: dist[csr.index[v]] for v in "ABCDE"} == {"A": 0, "B": 1, "C": 2, "D": 1, "E": -1}, "❌ CSR bfs wrong"
+    assert csr.get_neighbors("Z") == [], "❌ CSR unknown vertex should have no neighbors"
+
+    # Large ids take several varint bytes
+    big = AdjacencyListGraph()
+    for j in range(1, 300):
+        big.add_edge(0, j)
+    big.add_edge(299, 0)
+    packed = big.freeze().pack()
+    assert packed.neighbors(0) == list(range(1, 300)), "❌ Packed multi-byte varints wrong"
+    assert packed.neighbors(299) == [0], "❌ Packed last row wrong"
+
+    wg = WeightedGraph()
+    wg.add_edge("A", "C", 4)
+    wg.add_edge("A", "B", 1)
+    wg.add_edge("B", "C", 2)
+    csr = wg.freeze()
+    assert csr.weights.typecode == "q", "❌ int weights should be packed as int64"
+    assert csr.sssp(csr.index["A"])[csr.index["C"]] == 3, "❌ CSR sssp wrong"
+    packed = csr.pack()
+    a = packed.index["A"]
+    assert dict(zip(packed.get_neighbors("A"), packed.neighbor_weights(a))) == {"B": 1, "C": 4}, \
+        "❌ Packed weights not permuted with their neighbors"
+    print("  ✅ Weighted round-trip:", list(zip(packed.get_neighbors("A"), packed.neighbor_weights(a))))
+
+    mixed = WeightedGraph()
+    mixed.add_edge("A", "B", 2 ** 60 + 1)
+    mixed.add_edge("A", "C", 0.5)
+    assert mixed.freeze().weights == [2 ** 60 + 1, 0.5], "❌ mixed weights should stay an exact list"
+
+
+def test_singly_linked_list_arena():
+    print("\nTesting SinglyLinkedList arena...")
+    lst = SinglyLinkedList.from_iterable(range(6))
+    assert lst.to_list() == [0, 1, 2, 3, 4, 5], "❌ from_iterable order wrong"
+
+    # Remove head, tail and a middle node; their slots go on the free list
+    for value in (0, 5, 3):
+        assert lst.remove(value) is True, f"❌ remove({value}) failed"
+    assert lst.to_list() == [1, 2, 4] and len(lst) == 3, "❌ SinglyLinkedList wrong after removes"
+    assert len(lst._free) == 3, "❌ removed slots not put on the free list"
+    assert all(lst._values[slot] is None for slot in lst._free), "❌ freed slots still hold their values"
+
+    # New nodes reuse the freed slots instead of growing the arena
+    lst.append(10)
+    lst.prepend(-1)
+    lst.insert(2, 20)
+    assert lst.to_list() == [-1, 1, 20, 2, 4, 10], "❌ SinglyLinkedList wrong after reusing slots"
+    assert len(lst._values) == 6 and not lst._free, "❌ freed slots were not reused"
+    print("  ✅ Freed slots reused:", lst.to_list())
+
+    # The tail must still be right: the next appends land at the end
+    lst.append(11)
+    lst.extend([12, 13])
+    assert lst.to_list() == [-1, 1, 20, 2, 4, 10, 11, 12, 13], "❌ tail wrong after slot reuse"
+    assert lst.find(-1) == 0 and lst.index_of(13) == 8 and lst.find(99) is None, "❌ find/index_of wrong"
+    assert 20 in lst and 3 not in lst, "❌ __contains__ wrong"
+
+    try:
+        lst.remove(99)
+    except ValueError as e:
+        print("  ✅ Missing value raised:", e)
+    else:
+        raise AssertionError("❌ remove of a missing value did not raise")
+
+    # Drain the list completely, then reuse it
+    for value in lst.to_list():
+        lst.remove(value)
+    assert lst.to_list() == [] and len(lst) == 0, "❌ SinglyLinkedList not empty after removing everything"
+    lst.append(7)
+    lst.prepend(6)
+    assert lst.to_list() == [6, 7] and len(lst._values) == 9, "❌ SinglyLinkedList wrong after draining"
+    print("  ✅ Drained and refilled:", lst.to_list())
+
+
+def test_segment_tree():
+    print("\nTesting SegmentTree...")
+    data = list(range(1, 65))
+    st = SegmentTree(data)
+
+    def check(label):
+        for l, r in [(0, 63), (5, 5), (10, 40), (63, 63), (0, 0)]:
+            assert st.range_sum(l, r) == sum(data[l:r + 1]), f"❌ SegmentTree range_sum({l}, {r}) wrong {label}"
+
+    # All-int leaves: answered from prefix sums right after build
+    assert st._prefix is not None, "❌ prefix sums not built for int leaves"
+    check("from prefix sums")
+
+    # An update drops the prefix sums; queries walk the tree until a rebuild pays off
+    st.update(10, 100)
+    data[10] = 100
+    assert st._prefix is None, "❌ update did not drop the prefix sums"
+    assert st.range_sum(10, 10) == 100, "❌ tree walk wrong after update"
+    check("after update")
+    assert st._prefix is not None, "❌ prefix sums not rebuilt after enough queries"
+    print("  ✅ Prefix sums dropped on update and rebuilt once n // 32 queries had walked the tree")
+
+    # A float leaf disables the prefix path until every leaf is an int again
+    st.update(3, 0.5)
+    data[3] = 0.5
+    check("with a float leaf")
+    assert st._prefix is None, "❌ prefix sums used with a float leaf"
+    st.update(3, 4)
+    data[3] = 4
+    check("after restoring ints")
+    assert st._prefix is not None, "❌ prefix sums not re-enabled for all-int leaves"
+
+    # Float input always walks the tree, so results match a direct sum
+    assert SegmentTree([1e20, 1.0, 2.5]).range_sum(1, 2) == 3.5, "❌ float range_sum lost precision"
+    assert SegmentTree([0.1] * 10).range_sum(3, 3) == 0.1, "❌ float single-leaf range_sum wrong"
+    assert st.range_sum(5, 4) == 0, "❌ empty range should sum to 0"
+    print("  ✅ Float leaves use the tree:", SegmentTree([1e20, 1.0, 2.5]).range_sum(1, 2))
+
+
+def test_frozen_tree():
+    print("\nTesting BinaryTree.freeze / FrozenTree...")
+    #        1
+    #      /   \
+    #     2     3
+    #      \   /
+    #       4 5
+    #        \
+    #         6
+    root = BinaryTree(1)
+    root.left = BinaryTree(2)
+    root.right = BinaryTree(3)
+    root.left.right = BinaryTree(4)
+    root.right.left = BinaryTree(5)
+    root.right.left.right = BinaryTree(6)
+
+    frozen = root.freeze()
+    assert len(frozen) == 6, "❌ FrozenTree size wrong"
+    for name in ("inorder", "preorder", "postorder", "level_order"):
+        expected = getattr(root, name)()
+        assert getattr(frozen, name)() == expected, f"❌ FrozenTree.{name} differs from BinaryTree"
+        print(f"  ✅ {name}:", expected)
+    assert frozen.inorder() == [2, 4, 1, 5, 6, 3], "❌ FrozenTree.inorder wrong"
+
+    # freeze() is a snapshot: later edits to the tree do not show through
+    root.left.left = BinaryTree(7)
+    assert frozen.level_order() == [1, 2, 3, 4, 5, 6], "❌ FrozenTree changed with the source tree"
+
+    single = BinaryTree("x").freeze()
+    assert single.preorder() == single.postorder() == single.inorder() == ["x"], "❌ single-node FrozenTree wrong"
+
+    # A deep left-skewed tree must not hit the recursion limit
+    deep = BinaryTree(0)
+    node = deep
+    for i in range(1, 5000):
+        node.left = BinaryTree(i)
+        node = node.left
+    frozen = deep.freeze()
+    assert frozen.inorder() == list(range(4999, -1, -1)), "❌ deep FrozenTree.inorder wrong"
+    assert frozen.preorder() == list(range(5000)), "❌ deep FrozenTree.preorder wrong"
+    print("  ✅ 5000-deep skewed tree traversed without recursion")
+
 
 def run_all_tests():
     test_min_heap()
+    test_min_heap_typecode()
     test_max_heap()
     test_dary_heap()
-    print("\n🎯 All heap tests passed!")
+    test_sparse_matrix()
+    test_csr_graph()
+    test_singly_linked_list_arena()
+    test_segment_tree()
+    test_frozen_tree()
+    print("\n🎯 All tests passed!")
 
 
 if __name__ == "__main__":